@@ -0,0 +1,212 @@
+"""Time wordsearch generation and solving over a sweep of puzzle sizes.
+
+With the package installed, run from the repository root:
+
+    python benchmarks/benchmark.py --output results.json
+    python benchmarks/benchmark.py --output results.json --baseline baseline.json
+
+Every case is built from a fixed seed, so results only vary with the code
+and the machine. With '--baseline', timings are compared against a
+previous run's results and the script exits with status 1 if any stage is
+slower than the baseline by more than '--tolerance'. Stages taking less
+than '--min-time' in both runs are too noisy to compare and never count.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+from itertools import product
+
+import numpy
+
+from wordsearch.wordsearch import PlacementError, Wordsearch, fill_field, place_word
+
+
+SUITES = {
+    "quick": {
+        "sizes": [10, 50, 100],
+        "word_counts": [10, 100],
+        "word_lengths": [5],
+    },
+    "full": {
+        "sizes": [10, 100, 500, 2000],
+        "word_counts": [10, 100, 1000, 10000],
+        "word_lengths": [4, 8, 12],
+    },
+}
+
+# Cases whose words would cover more than this fraction of the field are skipped
+MAX_DENSITY = 0.3
+
+
+def get_words(count, length, rng, characters=Wordsearch.DEFAULT_CHARACTERS):
+    """Get 'count' random words of 'length' drawn from 'characters'."""
+    letters = rng.choice([*characters], (count, length))
+    return ["".join(row) for row in letters]
+
+
+def iter_cases(sizes, word_counts, word_lengths):
+    """Yield a dict describing each case of the sweep that isn't too dense."""
+    for size, word_count, word_length in product(sizes, word_counts, word_lengths):
+        if word_length > size:
+            continue
+        density = word_count * word_length / size ** 2
+        if density > MAX_DENSITY:
+            continue
+        yield {
+            "size": size,
+            "word_count": word_count,
+            "word_length": word_length,
+            "density": round(density, 4),
+        }
+
+
+def best_time(func, repeat):
+    """Get the fastest of 'repeat' timings of calling 'func', and its last result."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def run_case(case, seed, engines, repeat):
+    """Time each stage of generating and solving one 'case'."""
+    size = case["size"]
+    words = get_words(case["word_count"], case["word_length"], numpy.random.default_rng(seed))
+
+    def place_words():
+        field = numpy.full((size, size), None)
+        rng = numpy.random.default_rng(seed)
+        for word in words:
+            place_word(word, field, rng=rng)
+        return field
+
+    timings = {}
+    try:
+        timings["place_word"], field = best_time(place_words, repeat)
+    except PlacementError as error:
+        return {"case": case, "error": str(error)}
+
+    def fill():
+        return fill_field(field.copy(), Wordsearch.DEFAULT_CHARACTERS,
+                          rng=numpy.random.default_rng(seed))
+
+    timings["fill_field"], _ = best_time(fill, repeat)
+
+    def generate():
+        return Wordsearch.generate(words, size, size, rng=numpy.random.default_rng(seed))
+
+    timings["generate"], wordsearch = best_time(generate, repeat)
+
+    for engine in engines:
+        def solve():
+            return Wordsearch(wordsearch.field).solve(words, engine=engine)
+
+        timings[f"solve:{engine}"], matches = best_time(solve, repeat)
+
+    timings["as_string"], _ = best_time(wordsearch.as_string, repeat)
+    return {"case": case, "timings": timings, "matches": len(matches) if engines else None}
+
+
+def case_key(case):
+    return tuple(case[name] for name in ("size", "word_count", "word_length"))
+
+
+def compare(results, baseline, tolerance, min_time=0.0):
+    """Print each timing against 'baseline' and get the list of regressions.
+
+    Stages taking less than 'min_time' seconds in both runs aren't counted
+    as regressions, however their ratio varies.
+    """
+    baseline_timings = {
+        case_key(result["case"]): result.get("timings", {}) for result in baseline["results"]
+    }
+    regressions = []
+    for result in results["results"]:
+        key = case_key(result["case"])
+        for stage, timing in result.get("timings", {}).items():
+            previous = baseline_timings.get(key, {}).get(stage)
+            if not previous:
+                continue
+            ratio = timing / previous
+            flag = ""
+            if ratio > 1 + tolerance and max(timing, previous) >= min_time:
+                flag = "  SLOWER"
+                regressions.append((key, stage, ratio))
+            print(f"{key!s:<22} {stage:<22} {previous:>10.4f}s {timing:>10.4f}s "
+                  f"{ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--suite", choices=sorted(SUITES), default="quick")
+    parser.add_argument("--sizes", type=int, nargs="+", help="Override the suite's grid sizes")
+    parser.add_argument("--word-counts", type=int, nargs="+",
+                        help="Override the suite's word counts")
+    parser.add_argument("--word-lengths", type=int, nargs="+",
+                        help="Override the suite's word lengths")
+    parser.add_argument("--engines", nargs="*", default=["regex", "aho-corasick"],
+                        help="Solve engines to time")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Report the fastest of this many runs of each stage")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--baseline", help="Compare against results JSON at this path")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed slowdown against the baseline, as a fraction")
+    parser.add_argument("--min-time", type=float, default=0.01,
+                        help="Seconds below which a stage's timings aren't compared")
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    suite = SUITES[args.suite]
+    cases = iter_cases(
+        args.sizes or suite["sizes"],
+        args.word_counts or suite["word_counts"],
+        args.word_lengths or suite["word_lengths"],
+    )
+
+    results = {
+        "meta": {
+            "suite": args.suite,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "engines": args.engines,
+            "python": platform.python_version(),
+            "numpy": numpy.__version__,
+            "machine": platform.platform(),
+        },
+        "results": [],
+    }
+    for case in cases:
+        result = run_case(case, args.seed, args.engines, args.repeat)
+        results["results"].append(result)
+        timings = " ".join(
+            f"{stage}={timing:.4f}s" for stage, timing in result.get("timings", {}).items()
+        )
+        print(case_key(case), timings or result.get("error"), file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            regressions = compare(
+                results, json.load(baseline), args.tolerance, args.min_time
+            )
+        if regressions:
+            print(f"{len(regressions)} timings slower than the baseline", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
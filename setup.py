@@ -6,5 +6,10 @@ setup(
     packages=find_packages(),
     install_requires=[
         "numpy"
-    ]
+    ],
+    entry_points={
+        "console_scripts": [
+            "wordsearch = wordsearch.cli:main"
+        ]
+    }
 )
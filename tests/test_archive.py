@@ -0,0 +1,57 @@
+import numpy
+import pytest
+
+from wordsearch.archive import open_archive, save_archive
+from wordsearch.placements import Placement
+from wordsearch.wordsearch import Wordsearch
+
+
+def test_archive_round_trip(tmp_path):
+    path = tmp_path / "puzzles.wsa"
+    generated = [
+        Wordsearch.generate(["FOO", "BAR"], 5, 4, rng=numpy.random.default_rng(0)),
+        Wordsearch.generate(["BAZ"], 3, 6, dtype="S1", rng=numpy.random.default_rng(1)),
+        Wordsearch(numpy.array([["É", "ß"], ["中", "A"]], dtype="U1")),
+    ]
+
+    assert save_archive(path, iter(generated)) == 3
+    archive = open_archive(path)
+
+    assert len(archive) == 3
+    for original, loaded in zip(generated, archive):
+        assert loaded.field.dtype == original.field.dtype
+        assert (loaded.field == original.field).all()
+        assert loaded.words == original.words
+        assert loaded.placements == original.placements
+
+    assert isinstance(archive[0].placements[0], Placement)
+    assert archive[-1].words is None
+    assert archive[1].solve(["BAZ"])
+    with pytest.raises(IndexError):
+        archive[3]
+
+
+def test_archive_fields_are_views(tmp_path):
+    path = tmp_path / "puzzles.wsa"
+    save_archive(path, [Wordsearch(numpy.full((3, 3), "A", dtype="U1"))])
+
+    field = open_archive(path)[0].field
+
+    assert isinstance(field.base, numpy.memmap)
+    assert not field.flags.writeable
+    assert field.ctypes.data % 8 == 0
+
+
+def test_archive_empty(tmp_path):
+    path = tmp_path / "empty.wsa"
+    save_archive(path, [])
+
+    assert len(open_archive(path)) == 0
+
+
+def test_open_archive_invalid(tmp_path):
+    path = tmp_path / "invalid.wsa"
+    path.write_bytes(b"NOT AN ARCHIVE AT ALL")
+
+    with pytest.raises(ValueError, match="Not a wordsearch archive"):
+        open_archive(path)
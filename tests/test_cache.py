@@ -0,0 +1,45 @@
+import numpy
+
+from wordsearch.cache import SolveCache, CacheStats, fingerprint_field, estimate_size
+from wordsearch.search import WordMatch
+
+
+def test_fingerprint_field():
+    field = numpy.array([["A", "B"], ["C", "D"]], dtype="U1")
+
+    assert fingerprint_field(field) == fingerprint_field(field.copy())
+    assert fingerprint_field(field) != fingerprint_field(field.T)
+    assert fingerprint_field(field) != fingerprint_field(field.reshape(1, 4))
+    assert fingerprint_field(field) != fingerprint_field(field.astype("S1"))
+
+
+def test_solve_cache():
+    cache = SolveCache(max_entries=2)
+    matches = (WordMatch(word="FOO", start=(0, 0), end=(0, 2)),)
+
+    assert cache.get("a") is None
+    cache.put("a", matches)
+    cache.put("b", ())
+    assert cache.get("a") == matches
+    cache.put("c", ())
+
+    assert cache.get("b") is None
+    assert cache.get("a") == matches
+    assert cache.stats == CacheStats(
+        hits=2, misses=2, evictions=1, entries=2, size=estimate_size(matches) + estimate_size(())
+    )
+
+
+def test_solve_cache_max_size():
+    matches = (WordMatch(word="FOO", start=(0, 0), end=(0, 2)),)
+    cache = SolveCache(max_entries=None, max_size=2 * estimate_size(matches))
+
+    for key in range(3):
+        cache.put(key, matches)
+
+    assert len(cache) == 2
+    assert cache.get(0) is None
+    assert cache.stats.evictions == 1
+
+    cache.clear()
+    assert cache.stats.entries == cache.stats.size == 0
@@ -0,0 +1,154 @@
+import json
+
+import numpy
+import pytest
+
+from wordsearch.cli import main, rows_to_field, field_to_rows
+from wordsearch.wordsearch import Wordsearch
+
+
+def read_lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_field_rows():
+    field = numpy.array([["A", "B"], ["C", "D"]], dtype="U1")
+
+    assert field_to_rows(field) == ["AB", "CD"]
+    assert field_to_rows(field.astype("S1")) == ["AB", "CD"]
+    assert (rows_to_field(["AB", "CD"]) == field).all()
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_generate(tmp_path, workers):
+    specs = tmp_path / "specs.jsonl"
+    specs.write_text("\n".join([
+        json.dumps({"words": ["FOO", "BAR"], "width": 5, "height": 5}),
+        "",
+        json.dumps({"words": ["TOOLONG"], "width": 3, "height": 3}),
+        json.dumps({"words": ["BAZ"], "width": 4, "height": 3, "dtype": "S1"}),
+    ]))
+    output = tmp_path / "puzzles.jsonl"
+    argv = ["generate", str(specs), "--output", str(output), "--seed", "4"]
+    if workers:
+        argv += ["--workers", str(workers)]
+
+    main(argv)
+    puzzles = read_lines(output)
+
+    assert len(puzzles) == 3
+    assert "error" in puzzles[1]
+    assert [len(puzzle["field"]) for puzzle in puzzles[::2]] == [5, 3]
+    assert puzzles[2]["words"] == ["BAZ"]
+    for puzzle in puzzles[::2]:
+        wordsearch = Wordsearch(rows_to_field(puzzle["field"]))
+        for word, (row, column), _ in puzzle["placements"]:
+            assert wordsearch.field[row, column] == word[0]
+            assert wordsearch.first_match(word) is not None
+
+    main(["generate", str(specs), "--output", str(output), "--seed", "4"])
+    assert read_lines(output) == puzzles
+
+
+def test_generate_placement_error(tmp_path):
+    specs = tmp_path / "specs.jsonl"
+    specs.write_text(json.dumps({"words": ["ABC", "DEF", "GHI", "JKL"], "width": 3,
+                                 "height": 3}))
+    output = tmp_path / "puzzles.jsonl"
+
+    main(["generate", str(specs), "-o", str(output)])
+
+    assert "error" in read_lines(output)[0]
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_generate_invalid_spec(tmp_path, workers):
+    specs = tmp_path / "specs.jsonl"
+    specs.write_text("\n".join([
+        json.dumps({"words": ["FOO"], "width": 4, "height": 4, "strategy": "bogus"}),
+        json.dumps({"words": ["FOO"], "width": 4, "height": 4, "colour": "red"}),
+        json.dumps({"words": ["FOO"], "width": 4, "height": 4}),
+    ]))
+    output = tmp_path / "puzzles.jsonl"
+    argv = ["generate", str(specs), "-o", str(output)]
+    if workers:
+        argv += ["-w", str(workers)]
+
+    main(argv)
+    puzzles = read_lines(output)
+
+    # Bad specs give an error each, and the stream carries on past them
+    assert puzzles[0] == {"error": "Unknown strategy: bogus"}
+    assert "colour" in puzzles[1]["error"]
+    assert puzzles[2]["words"] == ["FOO"]
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_solve(tmp_path, workers):
+    puzzles = tmp_path / "puzzles.jsonl"
+    puzzles.write_text("\n".join([
+        json.dumps({"field": ["FOO", "OAA", "OAA"], "words": ["FOO", "BAR"]}),
+        json.dumps({"field": ["CAT"], "words": ["TAC"]}),
+    ]))
+    output = tmp_path / "matches.jsonl"
+    argv = ["solve", str(puzzles), "-o", str(output), "--engine", "aho-corasick"]
+    if workers:
+        argv += ["-w", str(workers)]
+
+    main(argv)
+
+    assert read_lines(output) == [
+        {"matches": [
+            {"word": "FOO", "start": [0, 0], "end": [0, 2]},
+            {"word": "FOO", "start": [0, 0], "end": [2, 0]},
+        ]},
+        {"matches": [{"word": "TAC", "start": [0, 2], "end": [0, 0]}]},
+    ]
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_solve_invalid_puzzles(tmp_path, workers):
+    puzzles = tmp_path / "puzzles.jsonl"
+    puzzles.write_text("\n".join([
+        json.dumps({"field": ["FOO"], "words": ["A+"]}),
+        json.dumps({"words": ["FOO"]}),
+        "{not json",
+        json.dumps({"field": ["FOO", "BA"], "words": ["FOO"]}),
+        json.dumps({"field": ["FOO"], "words": ["FOO"]}),
+        json.dumps({"field": [], "words": ["FOO"]}),
+    ]))
+    output = tmp_path / "matches.jsonl"
+    argv = ["solve", str(puzzles), "-o", str(output)]
+    if workers:
+        argv += ["-w", str(workers)]
+
+    main(argv)
+    results = read_lines(output)
+
+    # Each bad puzzle gives an error in its place, and the stream carries on past them
+    assert len(results) == 6
+    assert "nothing to repeat" in results[0]["error"]
+    assert results[1] == {"error": "Missing key: 'field'"}
+    assert results[2]["error"].startswith("Invalid JSON")
+    assert results[3] == {"error": "Rows must all be the same length"}
+    assert results[4] == {"matches": [{"word": "FOO", "start": [0, 0], "end": [0, 2]}]}
+    assert "error" in results[5]
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_generate_invalid_json(tmp_path, workers):
+    specs = tmp_path / "specs.jsonl"
+    specs.write_text("\n".join([
+        "{not json",
+        json.dumps({"words": ["FOO"], "width": 4, "height": 4}),
+    ]))
+    output = tmp_path / "puzzles.jsonl"
+    argv = ["generate", str(specs), "-o", str(output), "--seed", "2"]
+    if workers:
+        argv += ["-w", str(workers)]
+
+    main(argv)
+    puzzles = read_lines(output)
+
+    assert puzzles[0]["error"].startswith("Invalid JSON")
+    assert puzzles[1]["words"] == ["FOO"]
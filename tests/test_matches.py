@@ -0,0 +1,54 @@
+import numpy
+
+from wordsearch.matches import MATCH_DTYPE, MatchArray
+from wordsearch.search import WordMatch, find_all
+
+
+def test_match_array():
+    words = ["FOO", "BAR", "FOO"]
+    matches = [
+        WordMatch(word="BAR", start=(0, 2), end=(0, 0)),
+        WordMatch(word="FOO", start=(3, 1), end=(1, 3)),
+        WordMatch(word="BAR", start=(1, 1), end=(3, 3)),
+    ]
+
+    match_array = MatchArray.from_matches(matches, words)
+
+    assert match_array.records.dtype == MATCH_DTYPE
+    assert match_array.records.tolist() == [
+        (1, 0, 2, 0, 0, 1),
+        (0, 3, 1, 1, 3, 7),
+        (1, 1, 1, 3, 3, 4),
+    ]
+    assert len(match_array) == 3
+    assert [*match_array] == matches
+    assert match_array[1] == matches[1]
+    assert [*match_array[match_array.records["word"] == 1]] == matches[::2]
+    assert match_array.word_counts().tolist() == [1, 2, 0]
+
+
+def test_match_array_from_matches_without_words():
+    field = numpy.array([["C", "A", "T"], ["A", "T", "C"], ["T", "C", "A"]], dtype="U1")
+    matches = [*find_all("CAT", field), *find_all("AT", field)]
+
+    match_array = MatchArray.from_matches(iter(matches))
+
+    assert match_array.words == ["CAT", "AT"]
+    assert [*match_array] == matches
+    assert len(MatchArray.from_matches([])) == 0
+
+
+def test_match_array_coverage():
+    matches = [
+        WordMatch(word="FOO", start=(0, 0), end=(0, 2)),
+        WordMatch(word="FOO", start=(2, 2), end=(0, 0)),
+        WordMatch(word="A", start=(1, 2), end=(1, 2)),
+    ]
+
+    coverage = MatchArray.from_matches(matches).coverage((3, 3))
+
+    assert coverage.tolist() == [
+        [2, 1, 1],
+        [0, 1, 1],
+        [0, 0, 1],
+    ]
@@ -0,0 +1,50 @@
+import numpy
+import pytest
+
+from multiprocessing.shared_memory import SharedMemory
+
+from wordsearch.parallel import iter_chunks, imap_ordered, share_array, attach_array
+
+
+def test_iter_chunks():
+    assert [*iter_chunks(range(7), 3)] == [[0, 1, 2], [3, 4, 5], [6]]
+    assert [*iter_chunks([], 3)] == []
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_imap_ordered(workers):
+    results = imap_ordered(abs, range(0, -50, -1), workers=workers, chunksize=3)
+
+    assert [*results] == [*range(50)]
+
+
+def test_imap_ordered_lazy():
+    consumed = []
+
+    def items():
+        for item in range(100):
+            consumed.append(item)
+            yield item
+
+    results = imap_ordered(abs, items(), workers=1, chunksize=2, max_pending=2)
+
+    assert next(results) == 0
+    assert len(consumed) < 10
+    results.close()
+
+
+def test_share_array():
+    array = numpy.array([["A", "B"], ["C", "D"]], dtype="U1")
+
+    shared_memory, shared = share_array(array)
+    try:
+        with attach_array(shared) as attached:
+            assert attached.dtype == array.dtype
+            assert (attached == array).all()
+            del attached
+    finally:
+        shared_memory.close()
+        shared_memory.unlink()
+
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=shared.name)
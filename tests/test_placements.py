@@ -8,13 +8,30 @@ from wordsearch.placements import (
     get_reversed_placement,
     get_vertical_placement,
     get_reversed_vertical_placement,
+    get_diagonal_placement,
+    get_reversed_diagonal_placement,
+    get_antidiagonal_placement,
+    get_reversed_antidiagonal_placement,
     get_placement,
-    placement_is_valid
+    placement_is_valid,
+    random_integer,
+    random_choice,
+    Placement,
+    get_compact_placement,
+    compact_placement_is_valid,
+    write_placement,
+    occupancy_codes,
+    get_word_coordinates,
+    get_placement_candidates,
+    placement_to_list,
+    placement_from_list
 )
 
 randint = "wordsearch.placements.randint"
 standard_placement = "wordsearch.placements.get_standard_placement"
 reversed_placement = "wordsearch.placements.get_reversed_placement"
+diagonal_placement = "wordsearch.placements.get_diagonal_placement"
+reversed_diagonal_placement = "wordsearch.placements.get_reversed_diagonal_placement"
 
 
 @pytest.mark.parametrize("word", ["1", "TU", "TRE", "FOUR", "FIIVE"])
@@ -54,12 +71,118 @@ def test_reversed_vertical_placement():
     assert placement == mock_reversed_placement.return_value.T
 
 
+@pytest.mark.parametrize("word", ["1", "TU", "TRE", "FOUR"])
+def test_diagonal_placement(word):
+    with patch(randint, side_effect=[1, 0]):
+        placement = get_diagonal_placement(word, 5, 5)
+
+    assert [*placement[range(1, len(word) + 1), range(len(word))]] == [*word]
+    assert (placement != None).sum() == len(word)  # noqa: E711
+
+
+def test_reversed_diagonal_placement():
+    word = "FOO"
+
+    with patch(diagonal_placement) as mock_diagonal_placement:
+        get_reversed_diagonal_placement(word, 5, 5)
+
+    assert mock_diagonal_placement.call_args[0] == ("OOF", 5, 5)
+
+
+def test_antidiagonal_placement():
+    word = "FOO"
+    placement = numpy.full((5, 5), None)
+    placement[[0, 1, 2], [0, 1, 2]] = [*word]
+
+    with patch(diagonal_placement, return_value=placement) as mock_diagonal_placement:
+        placement = get_antidiagonal_placement(word, 5, 5)
+
+    assert mock_diagonal_placement.call_args[0] == (word, 5, 5)
+    assert "".join(placement[[0, 1, 2], [4, 3, 2]]) == word
+
+
+def test_reversed_antidiagonal_placement():
+    word = "FOO"
+    placement = numpy.full((5, 5), None)
+    placement[[0, 1, 2], [0, 1, 2]] = [*"OOF"]
+
+    with patch(reversed_diagonal_placement, return_value=placement) as mock_placement:
+        placement = get_reversed_antidiagonal_placement(word, 5, 5)
+
+    assert mock_placement.call_args[0] == (word, 5, 5)
+    assert "".join(placement[[2, 1, 0], [2, 3, 4]]) == word
+
+
 def test_get_placement():
     placement = get_placement("FOO", 5, 5)
 
     assert {*placement.flat} == {None, "F", "O"}
 
 
+def test_placement_coordinates():
+    placement = Placement(word="FOO", start=(4, 1), direction=(-1, 1))
+
+    rows, columns = placement.coordinates()
+
+    assert rows.tolist() == [4, 3, 2]
+    assert columns.tolist() == [1, 2, 3]
+
+
+def test_placement_list():
+    placement = Placement(word="FOO", start=(numpy.int64(4), 1), direction=(-1, 1))
+
+    item = placement_to_list(placement)
+
+    assert item == ["FOO", [4, 1], [-1, 1]]
+    assert type(item[1][0]) is int
+    assert placement_from_list(item) == placement
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("word", ["A", "FOO", "FIIVE"])
+def test_get_compact_placement(seed, word):
+    numpy.random.seed(seed)
+    placement = get_placement(word, 5, 7)
+
+    numpy.random.seed(seed)
+    compact_placement = get_compact_placement(word, 5, 7)
+
+    field = write_placement(compact_placement, numpy.full((7, 5), None))
+    assert (field == placement).all()
+
+
+def test_compact_placement_is_valid():
+    placement = Placement(word="FOO", start=(0, 1), direction=(0, 1))
+
+    assert compact_placement_is_valid(
+        placement,
+        numpy.array([[None, None, None, None, None]]),
+    )
+
+    assert compact_placement_is_valid(
+        placement,
+        numpy.array([[None, None, "O", "O", None]]),
+    )
+
+    assert not compact_placement_is_valid(
+        placement,
+        numpy.array([[None, None, "F", "O", "O"]]),
+    )
+
+    assert not compact_placement_is_valid(
+        placement,
+        numpy.array([["A", "A", "A", "A", "A"]], object),
+    )
+
+
+def test_write_placement():
+    field = numpy.full((3, 3), None)
+
+    write_placement(Placement(word="FOO", start=(2, 2), direction=(-1, 0)), field)
+
+    assert field[:, 2].tolist() == ["O", "O", "F"]
+
+
 def test_placement_is_valid():
     assert placement_is_valid(
         numpy.array([None, "F", "O", "O", None]),
@@ -85,3 +208,60 @@ def test_placement_is_valid():
         numpy.array([None, None, None, None, None]),
         numpy.array([None, None, None, None, None]),
     )
+
+
+def test_occupancy_codes():
+    field = numpy.array([[None, "A"], ["B", None]])
+
+    assert occupancy_codes(field).tolist() == [[0, ord("A")], [ord("B"), 0]]
+
+
+def test_get_word_coordinates():
+    rows, columns = get_word_coordinates(3, (2, 4), (-1, -1))
+
+    assert rows.tolist() == [2, 1, 0]
+    assert columns.tolist() == [4, 3, 2]
+
+
+def test_get_placement_candidates():
+    field = numpy.array(
+        [
+            ["F", None, None],
+            ["A", "A", "O"],
+            ["A", "A", "F"]
+        ]
+    )
+
+    candidates = get_placement_candidates("FOO", field)
+
+    assert sorted(zip(*(part.tolist() for part in candidates))) == [
+        (0, 0, 0),  # Left-right along the top row
+        (2, 2, 3),  # Bottom-top up the last column
+    ]
+
+
+def test_get_placement_candidates_none():
+    field = numpy.full((3, 3), "A", object)
+
+    rows, columns, directions = get_placement_candidates("FOO", field)
+
+    assert len(rows) == len(columns) == len(directions) == 0
+
+
+def test_random_helpers():
+    rng = numpy.random.default_rng(1)
+    assert 3 <= random_integer(3, 5, rng=rng) < 5
+    assert random_choice(["A"], rng=rng) == "A"
+
+    with patch(randint, return_value=4) as mock_randint:
+        assert random_integer(3, 5) == 4
+
+    mock_randint.assert_called_once_with(3, 5)
+
+
+def test_compact_placement_rng():
+    placements = [
+        get_compact_placement("FOO", 6, 6, rng=numpy.random.default_rng(7)) for _ in range(2)
+    ]
+
+    assert placements[0] == placements[1]
@@ -3,15 +3,48 @@ import pytest
 
 from unittest.mock import Mock, patch
 
+from tests.utils import fix_random_seed
+
 from wordsearch.search import (
     WordMatch,
+    LineIndex,
+    IncrementalLineIndex,
+    Lines,
+    flatten_field,
     match_is_valid,
     find_standard,
     find_reversed,
     find_vertical,
     find_reversed_vertical,
-    find_all
+    find_diagonal,
+    find_reversed_diagonal,
+    find_antidiagonal,
+    find_reversed_antidiagonal,
+    find_all,
+    DIRECTIONS,
+    AhoCorasick,
+    non_overlapping,
+    find_all_aho_corasick,
+    iter_direction_lines,
+    walk_trie,
+    discover_words,
+    field_codes,
+    find_windows,
+    find_all_numpy,
+    find_all_words,
+    find_literal,
+    find_all_literal,
+    find_all_anchored,
+    find_pattern,
+    iter_tiles,
+    find_all_in_tile,
+    merge_occurrences,
+    find_all_banded,
+    get_band_size,
+    get_direction_index,
+    get_solve_engine
 )
+from wordsearch.trie import Trie
 
 
 # Field width = 3
@@ -30,6 +63,49 @@ def test_valid_match(span, is_valid):
     assert match_is_valid(match, 3) == is_valid
 
 
+def test_line_index():
+    field = numpy.array(
+        [
+            ["A", "B", "C"],
+            ["D", "E", "F"]
+        ],
+        dtype="U1"
+    )
+
+    line_index = LineIndex(field)
+
+    assert line_index.lines((0, 1)).text == "ABCDEF"
+    assert line_index.lines((1, 0)).text == "ADBECF"
+    assert line_index.shape == (2, 3)
+    assert line_index.lines((0, 1)) is line_index.lines((0, 1))
+
+
+def test_lines():
+    field = numpy.array(
+        [
+            ["A", "B", "C"],
+            ["D", "E", "F"]
+        ],
+        dtype="U1"
+    )
+
+    diagonals = Lines.from_field(field, (1, 1))
+    assert [*diagonals.iter_lines()] == [
+        ("D", (1, 0)), ("AE", (0, 0)), ("BF", (0, 1)), ("C", (0, 2))
+    ]
+    assert diagonals.line_number(2) == 1
+    assert diagonals.coordinates(2) == (1, 1)
+
+    antidiagonals = Lines.from_field(field, (1, -1))
+    assert [*antidiagonals.iter_lines()] == [
+        ("F", (1, 2)), ("CE", (0, 2)), ("BD", (0, 1)), ("A", (0, 0))
+    ]
+    assert antidiagonals.coordinates(4) == (1, 0)
+
+    rows = Lines.from_field(field, (0, 1))
+    assert [*rows.iter_lines()] == [("ABC", (0, 0)), ("DEF", (1, 0))]
+
+
 # Word = "FOO"
 find_standard_test_cases = (
     (
@@ -242,6 +318,92 @@ def test_find_reversed_vertical(field, expected_matches):
         assert match == expected_match
 
 
+@pytest.mark.parametrize(
+    ("find_func", "word", "field", "expected_matches"),
+    [
+        (find_standard, "FOO", *find_standard_test_cases[1]),
+        (find_reversed, "BAR", *find_reversed_test_cases[1]),
+        (find_vertical, "JIM", *find_vertical_test_cases[1]),
+        (find_reversed_vertical, "BZZ", *find_reversed_vertical_test_cases[1]),
+    ]
+)
+def test_find_with_line_index(find_func, word, field, expected_matches):
+    line_index = LineIndex(field)
+
+    matches = [*find_func(word, field, line_index=line_index)]
+
+    assert matches == [*expected_matches]
+
+
+# Word = "CAT"
+diagonal_test_cases = (
+    (
+        find_diagonal,
+        numpy.array(
+            [
+                ["C", "X", "X", "X"],
+                ["X", "A", "X", "X"],
+                ["X", "X", "T", "X"]
+            ],
+            dtype="U1"
+        ),
+        [WordMatch(word="CAT", start=(0, 0), end=(2, 2))]
+    ),
+    (
+        find_reversed_diagonal,
+        numpy.array(
+            [
+                ["X", "T", "X", "X"],
+                ["X", "X", "A", "X"],
+                ["X", "X", "X", "C"]
+            ],
+            dtype="U1"
+        ),
+        [WordMatch(word="CAT", start=(2, 3), end=(0, 1))]
+    ),
+    (
+        find_antidiagonal,
+        numpy.array(
+            [
+                ["X", "X", "C", "X"],
+                ["X", "A", "X", "X"],
+                ["T", "X", "X", "X"]
+            ],
+            dtype="U1"
+        ),
+        [WordMatch(word="CAT", start=(0, 2), end=(2, 0))]
+    ),
+    (
+        find_reversed_antidiagonal,
+        numpy.array(
+            [
+                ["X", "X", "X", "T"],
+                ["X", "X", "A", "X"],
+                ["X", "C", "X", "X"]
+            ],
+            dtype="U1"
+        ),
+        [WordMatch(word="CAT", start=(2, 1), end=(0, 3))]
+    ),
+)
+
+
+@pytest.mark.parametrize(("find_func", "field", "expected_matches"), diagonal_test_cases)
+def test_find_diagonals(find_func, field, expected_matches):
+    assert [*find_func("CAT", field)] == expected_matches
+
+    line_index = LineIndex(field)
+    assert [*find_func("CAT", field, line_index=line_index)] == expected_matches
+
+
+def test_find_diagonal_line_boundary():
+    field = numpy.array([["A", "B"], ["C", "D"]], dtype="U1")
+
+    # The diagonal text is "C" "AD" "B", so "CA" spans two diagonals. Reject!
+    assert [*find_diagonal("CA", field)] == []
+    assert [*find_diagonal("AD", field)] == [WordMatch(word="AD", start=(0, 0), end=(1, 1))]
+
+
 def test_find_all():
     word = "BLAH"
     field = numpy.ones((1, 1))
@@ -252,3 +414,374 @@ def test_find_all():
 
     assert mock_find_func.called_once_with(word, field)
     assert len(matches) == 0
+
+
+def test_aho_corasick():
+    automaton = AhoCorasick(["HE", "SHE", "HERS", "E"])
+
+    matches = sorted(automaton.iter_matches("USHERS"))
+
+    assert matches == [(1, 1), (2, 0), (2, 2), (3, 3)]
+
+
+def test_non_overlapping():
+    assert [*non_overlapping([0, 1, 2, 3, 5], 2)] == [0, 2, 5]
+
+
+@fix_random_seed()
+def test_find_all_aho_corasick():
+    field = numpy.random.choice([*"AB"], (7, 5)).astype("U1")
+    words = ["A", "AB", "BA", "ABA", "BBB", "AAAA", "AB"]
+
+    matches = [*find_all_aho_corasick(words, field)]
+
+    assert matches == [match for word in words for match in find_all(word, field)]
+
+
+def test_iter_direction_lines():
+    field = numpy.array([["A", "B", "C"], ["D", "E", "F"]], dtype="U1")
+    line_index = LineIndex(field)
+
+    assert [*iter_direction_lines((0, 1), line_index)] == [("ABC", (0, 0)), ("DEF", (1, 0))]
+    assert [*iter_direction_lines((0, -1), line_index)] == [("CBA", (0, 2)), ("FED", (1, 2))]
+    assert [*iter_direction_lines((1, 0), line_index)] == [
+        ("AD", (0, 0)), ("BE", (0, 1)), ("CF", (0, 2))
+    ]
+    assert [*iter_direction_lines((-1, 0), line_index)] == [
+        ("DA", (1, 0)), ("EB", (1, 1)), ("FC", (1, 2))
+    ]
+
+
+def test_walk_trie():
+    trie = Trie(["F", "FO", "FOOD", "OO"])
+
+    assert [*walk_trie(trie, "XFOOD", 1)] == [(1, "F"), (2, "FO"), (4, "FOOD")]
+    assert [*walk_trie(trie, "XFOOD", 1, min_length=2)] == [(2, "FO"), (4, "FOOD")]
+    assert [*walk_trie(trie, "XFOOD", 0)] == []
+
+
+@fix_random_seed()
+def test_discover_words():
+    field = numpy.random.choice([*"ABC"], (6, 7)).astype("U1")
+    words = ["ABC", "CAB", "BC", "CCA", "ACB"]
+
+    matches = [*discover_words(Trie(words), field, min_length=3)]
+
+    expected = [match for word in words if len(word) >= 3 for match in find_all(word, field)]
+    assert len(matches) == len(expected)
+    assert sorted(matches) == sorted(expected)
+
+
+def test_find_windows():
+    field = numpy.array([["A", "B", "A"], ["B", "A", "B"]], dtype="U1")
+    codes = field_codes(field)
+    word_codes = field_codes(numpy.array(["A", "B"], dtype="U1"))
+
+    rows, columns = find_windows(codes, word_codes, (0, 1))
+    assert [*zip(rows, columns)] == [(0, 0), (1, 1)]
+
+    rows, columns = find_windows(codes, word_codes, (1, 0))
+    assert [*zip(rows, columns)] == [(0, 0), (0, 2)]
+
+    rows, columns = find_windows(codes, word_codes, (1, 1))
+    assert [*zip(rows, columns)] == []
+
+    rows, columns = find_windows(codes, field_codes(numpy.array([*"BB"], "U1")), (1, -1))
+    assert [*zip(rows, columns)] == [(0, 1)]
+
+    rows, columns = find_windows(codes, field_codes(numpy.array([*"AA"], "U1")), (1, -1))
+    assert [*zip(rows, columns)] == [(0, 2)]
+
+    rows, columns = find_windows(codes, field_codes(numpy.array([*"ABA"], "U1")), (1, 0))
+    assert len(rows) == len(columns) == 0
+
+
+@fix_random_seed()
+def test_find_all_numpy():
+    field = numpy.random.choice([*"ABC"], (6, 7)).astype("U1")
+    words = ["ABC", "CAB", "BC", "C"]
+
+    matches = [*find_all_numpy(words, field)]
+
+    expected = [match for word in words for match in find_all(word, field)]
+    assert sorted(matches) == sorted(expected)
+
+
+def test_find_all_numpy_overlapping():
+    field = numpy.array([["A", "A", "A"]], dtype="U1")
+
+    matches = [*find_all_numpy(["AA"], field)]
+
+    assert matches == [
+        WordMatch(word="AA", start=(0, 0), end=(0, 1)),
+        WordMatch(word="AA", start=(0, 1), end=(0, 2)),
+        WordMatch(word="AA", start=(0, 1), end=(0, 0)),
+        WordMatch(word="AA", start=(0, 2), end=(0, 1)),
+    ]
+
+
+def test_flatten_byte_field():
+    field = numpy.array([["A", "B"], ["C", "D"]], dtype="S1")
+
+    assert flatten_field(field) == b"ABCD"
+    assert flatten_field(field.T) == b"ACBD"
+    assert flatten_field(field.view(numpy.uint8)) == b"ABCD"
+
+
+@pytest.mark.parametrize("dtype", ["S1", numpy.uint8])
+@fix_random_seed()
+def test_find_all_byte_field(dtype):
+    field = numpy.random.choice([*"AB"], (6, 5)).astype("U1")
+    byte_field = field.astype("S1").view(dtype)
+    words = ["AB", "BBA", "A"]
+
+    for find_words in (find_all_aho_corasick, find_all_numpy):
+        assert [*find_words(words, byte_field)] == [*find_words(words, field)]
+
+    for word in words:
+        line_index = LineIndex(byte_field)
+        assert [*find_all(word, byte_field, line_index)] == [*find_all(word, field)]
+
+    trie = Trie(words)
+    assert [*discover_words(trie, byte_field)] == [*discover_words(trie, field)]
+
+
+def test_find_all_words():
+    field = numpy.array([["F", "O", "O"], ["A", "B", "A"]], dtype="U1")
+
+    matches = [*find_all_words(["FOO", "AB"], field)]
+
+    assert matches == [*find_all("FOO", field), *find_all("AB", field)]
+
+
+def test_iter_tiles():
+    tiles = [*iter_tiles((3, 5), 2, 1)]
+
+    assert tiles == [
+        (slice(0, 3), slice(0, 3), (slice(0, 2), slice(0, 2))),
+        (slice(0, 3), slice(2, 5), (slice(0, 2), slice(2, 4))),
+        (slice(0, 3), slice(4, 5), (slice(0, 2), slice(4, 6))),
+        (slice(2, 3), slice(0, 3), (slice(2, 4), slice(0, 2))),
+        (slice(2, 3), slice(2, 5), (slice(2, 4), slice(2, 4))),
+        (slice(2, 3), slice(4, 5), (slice(2, 4), slice(4, 6))),
+    ]
+
+
+@pytest.mark.parametrize("band_size", [1, 2, 3, 5, 100])
+@fix_random_seed()
+def test_find_all_banded(band_size):
+    field = numpy.random.choice([*"ABC"], (9, 11)).astype("U1")
+    words = ["ABC", "CAB", "BC", "C", "ACCB"]
+
+    matches = [*find_all_banded(words, field, band_size=band_size)]
+
+    assert sorted(matches) == sorted(find_all_words(words, field))
+    if band_size == 100:
+        assert matches == [*find_all_words(words, field)]
+
+
+@pytest.mark.parametrize("engine", ["regex", "literal", "anchored"])
+@pytest.mark.parametrize("band_size", [1, 2, 3])
+def test_find_all_banded_runs(engine, band_size):
+    # Long runs of "A" along every line make each skipped overlap depend on the last
+    field = numpy.random.default_rng(2).choice([*"AB"], (10, 9), p=[0.85, 0.15]).astype("U1")
+    words = ["AA", "AAA", "ABA", "AA"]
+
+    matches = [*find_all_banded(words, field, band_size=band_size, engine=engine)]
+
+    assert sorted(matches) == sorted(get_solve_engine(engine)(words, field))
+
+
+@pytest.mark.parametrize(("engine", "expected_count"), [("regex", 2), ("literal", 4)])
+def test_find_all_banded_overlapping(engine, expected_count):
+    field = numpy.array([["A", "A", "A"]], dtype="U1")
+
+    # Each tile owns an "AA" each way, but the regex engine skips the second of a line
+    matches = [*find_all_banded(["AA"], field, band_size=1, engine=engine)]
+
+    assert sorted(matches) == sorted(get_solve_engine(engine)(["AA"], field))
+    assert len(matches) == expected_count
+
+
+@pytest.mark.parametrize(("engine", "expected_tiles"), [("regex", 2), ("literal", 1)])
+def test_find_all_banded_streams(engine, expected_tiles):
+    field = numpy.full((6, 6), "X", dtype="U1")
+    field[0, :2] = ["A", "B"]
+
+    in_tile = "wordsearch.search.find_all_in_tile"
+    with patch(in_tile, wraps=find_all_in_tile) as mock_find_all_in_tile:
+        matches = find_all_banded(["AB"], field, band_size=2, engine=engine)
+        first_match = next(matches)
+
+    # The regex engine waits for the next tile of the band, which may hold earlier text
+    assert first_match == WordMatch(word="AB", start=(0, 0), end=(0, 1))
+    assert mock_find_all_in_tile.call_count == expected_tiles
+
+
+def test_find_all_banded_regex_pattern():
+    field = numpy.array([["A", "X", "B"]], dtype="U1")
+
+    with pytest.raises(ValueError, match="regex pattern: A.B"):
+        next(find_all_banded(["A.B"], field))
+
+
+def test_find_literal():
+    assert [*find_literal("AA", "AAAXAA")] == [0, 1, 4]
+    assert [*find_literal(b"A.", b"ABA.")] == [2]
+    assert [*find_literal("B", "AAA")] == []
+
+
+@fix_random_seed()
+def test_find_all_literal():
+    field = numpy.random.choice([*"ABC"], (6, 7)).astype("U1")
+    words = ["ABC", "CAB", "BC", "C"]
+
+    matches = [*find_all_literal(words, field)]
+
+    assert matches == [*find_all_words(words, field)]
+
+
+def test_find_all_literal_overlapping():
+    field = numpy.array([["A", "A", "A"], ["A", "X", "X"]], dtype="U1")
+
+    matches = [*find_all_literal(["AA", "A*"], field)]
+
+    assert matches == [
+        WordMatch(word="AA", start=(0, 0), end=(0, 1)),
+        WordMatch(word="AA", start=(0, 1), end=(0, 2)),
+        WordMatch(word="AA", start=(0, 1), end=(0, 0)),
+        WordMatch(word="AA", start=(0, 2), end=(0, 1)),
+        WordMatch(word="AA", start=(0, 0), end=(1, 0)),
+        WordMatch(word="AA", start=(1, 0), end=(0, 0)),
+        WordMatch(word="AA", start=(0, 1), end=(1, 0)),
+        WordMatch(word="AA", start=(1, 0), end=(0, 1)),
+    ]
+
+
+def test_find_all_in_tile():
+    field = numpy.array([["X", "F", "O", "O"], ["X", "X", "F", "O"]], dtype="U1")
+    tile = (slice(0, 2), slice(1, 4), (slice(0, 1), slice(1, 2)))
+
+    occurrences = [*find_all_in_tile(["FOO", "FO"], field, tile)]
+
+    # The "FO" from (1, 2) is within the tile, but not in the area it owns
+    assert occurrences == [("FOO", 0, (0, 1)), ("FO", 0, (0, 1))]
+
+
+@pytest.mark.parametrize(
+    ("engine", "expected_starts"),
+    [("regex", [(0, 0), (0, 2)]), ("literal", [(0, 0), (0, 1), (0, 2)])]
+)
+def test_merge_occurrences(engine, expected_starts):
+    occurrences = [("AA", 1, (0, 0)), ("AA", 0, (0, 2)), ("AA", 0, (0, 0)), ("AA", 0, (0, 1))]
+
+    matches = merge_occurrences(occurrences, ["AA", "B", "AA"], (1, 4), engine=engine)
+
+    forward = [WordMatch(word="AA", start=(row, column), end=(row, column + 1))
+               for row, column in expected_starts]
+    reversed_match = WordMatch(word="AA", start=(0, 1), end=(0, 0))
+    assert matches == [*forward, reversed_match, *forward, reversed_match]
+
+
+def test_get_band_size():
+    assert get_band_size((100, 100), 4) == 25
+    assert get_band_size((1, 1000), 8) == 5
+    assert get_band_size((2, 2), 8) == 1
+
+
+def test_get_direction_index():
+    for index, (row_step, column_step) in enumerate(DIRECTIONS):
+        end = (5 + 2 * row_step, 5 + 2 * column_step)
+        word_match = WordMatch(word="FOO", start=(5, 5), end=end)
+        assert get_direction_index(word_match) == index
+
+    assert get_direction_index(WordMatch(word="F", start=(1, 1), end=(1, 1))) == 0
+
+
+@pytest.mark.parametrize("dtype", ["U1", "S1"])
+def test_incremental_line_index(dtype):
+    rng = numpy.random.default_rng(3)
+    field = rng.choice([*"AB"], (4, 6)).astype(dtype)
+    line_index = IncrementalLineIndex(field)
+    assert [*line_index.find_all("AB")] == [*find_all("AB", field)]
+    joined = line_index.lines((1, 1))
+
+    for row, column in [(0, 5), (3, 0), (2, 2), (1, 4)]:
+        field[row, column] = "B" if field[row, column] in ("A", b"A") else "A"
+        line_index.update(row, column)
+
+    # Joined lines are patched rather than rebuilt
+    assert line_index.lines((1, 1)).starts is joined.starts
+    for axis in DIRECTIONS[::2]:
+        lines = Lines.from_field(field, axis)
+        assert line_index.lines(axis).text == lines.text
+        assert [*line_index.lines(axis).starts] == [*lines.starts]
+    assert [*line_index.find_all("AB")] == [*find_all("AB", field)]
+
+
+def test_line_index_positions():
+    field = numpy.array([["Q", "A", "A"], ["A", "Q", "A"]], dtype="S1")
+    line_index = LineIndex(field)
+
+    rows, columns = line_index.positions("Q")
+
+    assert rows.tolist() == [0, 1]
+    assert columns.tolist() == [0, 1]
+    assert line_index.count("A") == 4
+    assert line_index.count("Z") == 0
+
+
+def test_line_index_offsets():
+    field = numpy.array([[*"ABCD"], [*"EFGH"], [*"IJKL"]], dtype="U1")
+    line_index = LineIndex(field)
+    rows, columns = numpy.nonzero(field != "")
+
+    for axis in DIRECTIONS[::2]:
+        lines = line_index.lines(axis)
+        offsets = line_index.offsets(axis, rows, columns)
+        assert [lines.text[offset] for offset in offsets] == [*flatten_field(field)]
+
+
+@pytest.mark.parametrize("dtype", ["U1", "S1"])
+def test_find_all_anchored(dtype):
+    words = ["ABA", "BQ", "AAQ", "QQQ", "AB"]
+    rng = numpy.random.default_rng(4)
+    field = rng.choice([*"AABQ"], (9, 7)).astype(dtype)
+
+    matches = [*find_all_anchored(words, field)]
+
+    assert matches == [match for word in words for match in find_all(word, field)]
+
+
+def test_find_pattern():
+    field = numpy.array([["C", "A", "T"], ["O", "U", "T"], ["T", "A", "C"]], dtype="U1")
+
+    assert [*find_pattern("C?T", field)] == [
+        WordMatch(word="CAT", start=(0, 0), end=(0, 2)),
+        WordMatch(word="CAT", start=(2, 2), end=(2, 0)),
+        WordMatch(word="COT", start=(0, 0), end=(2, 0)),
+        WordMatch(word="CTT", start=(2, 2), end=(0, 2)),
+    ]
+
+
+@pytest.mark.parametrize("dtype", ["U1", "S1"])
+def test_find_pattern_wildcards(dtype):
+    field = numpy.array([["Q", "U", "I", "Z"], ["U", "Q", "U", "A"]], dtype=dtype)
+
+    matches = [match for match in find_pattern("QU*", field) if match.word[0] == "Q"]
+    assert [match.word for match in matches if match.start[0] == 0][:3] == ["QU", "QUI", "QUIZ"]
+    assert WordMatch(word="QUA", start=(1, 1), end=(1, 3)) in matches
+
+    matches = [*find_pattern("Q*Z", field)]
+    assert matches == [WordMatch(word="QUIZ", start=(0, 0), end=(0, 3))]
+
+    matches = [*find_pattern("*U*A", field)]
+    assert [match.word for match in matches] == ["UQUA", "QUA", "UA"]
+    assert all(match.start[0] == 1 for match in matches)
+
+
+def test_find_pattern_literal():
+    rng = numpy.random.default_rng(6)
+    field = rng.choice([*"AB"], (6, 5)).astype("U1")
+
+    assert [*find_pattern("ABA", field)] == [*find_all_literal(["ABA"], field)]
@@ -0,0 +1,28 @@
+from collections import Counter
+
+from wordsearch.stats import Stats, direction_key
+
+
+def test_direction_key():
+    assert direction_key((1, -1)) == "1,-1"
+
+
+def test_stats():
+    stats = Stats()
+    stats.record_placement("FOO", (0, 1), False)
+    stats.record_placement("FOO", (1, 0), False)
+    stats.record_placement("FOO", (0, 1), True)
+    stats.record_placement("BAR", (1, 0), False)
+    stats.record_scan((0, 1), 0.5, 2)
+    stats.record_scan((0, 1), 0.25, 1)
+
+    assert stats.placement_attempts == {"FOO": 3, "BAR": 1}
+    assert stats.rejections_by_direction() == Counter({(1, 0): 2, (0, 1): 1})
+    assert stats.as_dict() == {
+        "placement_attempts": {"FOO": 3, "BAR": 1},
+        "placement_rejections": {"FOO": {"0,1": 1, "1,0": 1}, "BAR": {"1,0": 1}},
+        "fill_time": 0.0,
+        "solve_time": 0.0,
+        "scan_time": {"0,1": 0.75},
+        "scan_matches": {"0,1": 3},
+    }
@@ -0,0 +1,12 @@
+from wordsearch.trie import Trie
+
+
+def test_trie():
+    trie = Trie(["FOO", "FOOD", "BAR", "FOO"])
+
+    assert len(trie) == 3
+    assert "FOO" in trie
+    assert "FOOD" in trie
+    assert "FO" not in trie
+    assert "BARN" not in trie
+    assert trie.root["F"]["O"]["O"][Trie.END] == "FOO"
@@ -1,21 +1,42 @@
+import re
+
 import numpy
 import pytest
 
 from unittest.mock import Mock, patch
 
 from tests.utils import fix_random_seed
-from wordsearch.search import WordMatch
+from wordsearch.cache import SolveCache
+from wordsearch.placements import Placement
+from wordsearch.search import (
+    DIRECTIONS,
+    WordMatch,
+    LineIndex,
+    IncrementalLineIndex,
+    Lines,
+    iter_tiles
+)
+from wordsearch.stats import Stats
 from wordsearch.wordsearch import (
     MAX_PLACEMENT_ATTEMPTS,
     WordsearchInitialisationError,
     PlacementError,
     validate_word_and_field,
     place_word,
+    backtrack_placements,
     fill_field,
+    index_word_splits,
+    get_forbidden_letters,
+    to_byte_field,
+    to_unicode_field,
+    solve_many,
+    index_words,
+    to_match_records,
+    from_match_records,
     Wordsearch
 )
 
-get_placement = "wordsearch.wordsearch.get_placement"
+get_compact_placement = "wordsearch.wordsearch.get_compact_placement"
 
 
 def test_validate_word_and_field():
@@ -27,29 +48,78 @@ def test_place_word():
     word = "FOO"
     field = numpy.full((5, 5), None)
 
-    placement = field.copy()
-    placement[2, :3] = [*word]
+    placement = Placement(word=word, start=(2, 0), direction=(0, 1))
 
-    with patch(get_placement, return_value=placement):
+    with patch(get_compact_placement, return_value=placement):
         field = place_word(word, field)
 
     assert "".join(field[2, :3]) == word
+    assert (field != None).sum() == len(word)  # noqa: E711
 
 
 def test_place_word_placement_error():
     word = "FOO"
     field = numpy.full((5, 5), "A", object)
 
-    placement = field.copy()
-    placement[2, :3] = [*word]
+    placement = Placement(word=word, start=(2, 0), direction=(0, 1))
 
-    with patch(get_placement, return_value=placement) as mock_get_placement:
+    with patch(get_compact_placement, return_value=placement) as mock_get_placement:
         with pytest.raises(PlacementError):
             place_word(word, field)
 
     assert mock_get_placement.call_count == MAX_PLACEMENT_ATTEMPTS
 
 
+def test_place_word_enumerate():
+    word = "FOO"
+    field = numpy.full((3, 3), "A", object)
+    field[0, 1] = None
+    field[:, 2] = [None, "O", "F"]
+
+    with patch(get_compact_placement) as mock_get_placement:
+        field = place_word(word, field, placement="enumerate")
+
+    assert not mock_get_placement.called
+    assert "".join(field[::-1, 2]) == word
+
+
+def test_place_word_enumerate_placement_error():
+    field = numpy.full((3, 3), "A", object)
+
+    with pytest.raises(PlacementError):
+        place_word("FOO", field, placement="enumerate")
+
+
+def test_place_word_unknown_placement():
+    with pytest.raises(ValueError, match="Unknown placement"):
+        place_word("FOO", numpy.full((3, 3), None), placement="magic")
+
+
+@fix_random_seed()
+def test_backtrack_placements():
+    words = ["ABCD", "EFGH", "IJKL", "MNOP", "AEIM"]
+
+    field, placements, nodes_explored = backtrack_placements(words, numpy.full((4, 4), None))
+
+    assert None not in field
+    assert nodes_explored >= len(words)
+    assert sorted(placement.word for placement in placements) == sorted(words)
+    for placement in placements:
+        assert "".join(field[placement.coordinates()]) == placement.word
+    found = Wordsearch(field.astype("U1")).solve(words)
+    assert {match.word for match in found} == {*words}
+
+
+def test_backtrack_placements_impossible():
+    with pytest.raises(PlacementError, match="after exploring"):
+        backtrack_placements(["ABC", "DEF", "GHI", "JKL"], numpy.full((3, 3), None))
+
+
+def test_backtrack_placements_time_budget():
+    with pytest.raises(PlacementError, match="Ran out of time"):
+        backtrack_placements(["ABC"], numpy.full((3, 3), None), time_budget=-1)
+
+
 def test_fill_field():
     field = numpy.full((5, 5), None)
     field[2, 2] = "X"
@@ -59,33 +129,101 @@ def test_fill_field():
     assert {*field.flat}.issubset({"A", "B", "C", "X"})
 
 
+def test_index_word_splits():
+    splits = index_word_splits(["CAT"])
+
+    assert splits[("", "AT")] == {"C"}
+    assert splits[("C", "T")] == {"A"}
+    assert splits[("TA", "")] == {"C"}
+    assert splits[("", "AC")] == {"T"}
+    assert ("C", "") not in splits
+
+
+def test_get_forbidden_letters():
+    field = numpy.array([
+        ["C", None, "T"],
+        [None, None, "A"],
+        ["T", None, "C"],
+    ])
+    splits = index_word_splits(["CAT", "CX"])
+
+    assert get_forbidden_letters(field, 0, 1, splits, {2, 3}) == {"A", "X"}
+    assert get_forbidden_letters(field, 1, 1, splits, {2, 3}) == {"X"}
+    assert get_forbidden_letters(field, 2, 1, splits, {2, 3}) == {"A", "X"}
+
+
+def test_fill_field_unique():
+    field = numpy.array([["C", None, "T"], [None, None, None]])
+
+    with pytest.raises(PlacementError):
+        fill_field(field.copy(), "A", words=["CAT"])
+
+    filled = fill_field(field, "AX", words=["CAT"])
+    assert filled[0, 1] == "X"
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_generate_unique(seed):
+    words = ["CAB", "BAD", "ACE"]
+    wordsearch = Wordsearch.generate(
+        words, 8, 8, characters="ABCDE", unique=True, rng=numpy.random.default_rng(seed)
+    )
+
+    matches = wordsearch.solve(words, engine="literal")
+    assert sorted(match.word for match in matches) == sorted(words)
+
+
 @fix_random_seed()
 def test_generate():
     wordsearch = Wordsearch.generate(["FOO", "BAR", "BAZ"], 5, 5)
 
     assert wordsearch.field.tolist() == [
-        ["R", "A", "B", "O", "Q"],
-        ["F", "Q", "J", "O", "P"],
-        ["X", "Q", "M", "F", "C"],
-        ["G", "Z", "A", "B", "A"],
-        ["J", "L", "Q", "D", "C"]
+        ["B", "M", "W", "Y", "Q"],
+        ["F", "A", "Z", "W", "P"],
+        ["X", "A", "R", "O", "C"],
+        ["B", "D", "O", "L", "A"],
+        ["J", "F", "Q", "D", "C"]
     ]
 
     assert wordsearch.as_string() == "\n".join([
         "|---|---|---|---|---|",
-        "| R | A | B | O | Q |",
+        "| B | M | W | Y | Q |",
         "|---|---|---|---|---|",
-        "| F | Q | J | O | P |",
+        "| F | A | Z | W | P |",
         "|---|---|---|---|---|",
-        "| X | Q | M | F | C |",
+        "| X | A | R | O | C |",
         "|---|---|---|---|---|",
-        "| G | Z | A | B | A |",
+        "| B | D | O | L | A |",
         "|---|---|---|---|---|",
-        "| J | L | Q | D | C |",
+        "| J | F | Q | D | C |",
         "|---|---|---|---|---|"
     ])
 
 
+@fix_random_seed()
+def test_generate_enumerate():
+    words = ["ABCD", "EFGH", "IJKL", "MNOP"]
+
+    wordsearch = Wordsearch.generate(words, 4, 4, placement="enumerate")
+
+    assert sorted(match.word for match in wordsearch.solve(words)) == words
+
+
+@fix_random_seed()
+def test_generate_backtrack():
+    words = ["ABCDE", "FGHIJ", "KLMNO", "PQRST", "AFKP"]
+
+    wordsearch = Wordsearch.generate(words, 5, 5, strategy="backtrack")
+
+    assert wordsearch.nodes_explored >= len(words)
+    assert {match.word for match in wordsearch.solve(words)} == {*words}
+
+
+def test_generate_unknown_strategy():
+    with pytest.raises(ValueError, match="Unknown strategy"):
+        Wordsearch.generate(["FOO"], 5, 5, strategy="magic")
+
+
 def test_initialisation():
     field = numpy.array(
         [
@@ -100,6 +238,56 @@ def test_initialisation():
     assert (wordsearch.field == field).all()
 
 
+@pytest.mark.parametrize("dtype", ["S1", numpy.uint8])
+def test_initialisation_byte_field(dtype):
+    field = numpy.array([["A", "B"], ["C", "D"]], dtype="S1").view(dtype)
+
+    wordsearch = Wordsearch(field)
+
+    assert wordsearch.field is field
+
+
+def test_byte_field_conversions():
+    field = numpy.array([["A", "B"], ["C", "D"]], dtype="U1")
+
+    byte_field = to_byte_field(field)
+    assert byte_field.dtype == "S1"
+    assert byte_field.nbytes == field.nbytes // 4
+    assert (to_unicode_field(byte_field) == field).all()
+    assert (to_unicode_field(byte_field.view(numpy.uint8)) == field).all()
+
+    wordsearch = Wordsearch(field).to_bytes()
+    assert wordsearch.field.dtype == "S1"
+    assert (wordsearch.to_unicode().field == field).all()
+    assert wordsearch.as_string() == Wordsearch(field).as_string()
+
+
+@pytest.mark.parametrize("dtype", ["S1", "uint8"])
+@fix_random_seed()
+def test_generate_byte_field(dtype):
+    wordsearch = Wordsearch.generate(["FOO", "BAR", "BAZ"], 5, 5, dtype=dtype)
+
+    assert wordsearch.field.dtype == dtype
+    assert len(wordsearch.solve(["FOO", "BAR", "BAZ"])) == 3
+
+
+@pytest.mark.parametrize("engine", ["regex", "aho-corasick", "numpy", "literal", "anchored"])
+@pytest.mark.parametrize("dtype", ["S1", numpy.uint8])
+def test_solve_byte_field_non_ascii(engine, dtype):
+    field = numpy.array([["A", "B"], ["C", "D"]], dtype="S1").view(dtype)
+    expected = [WordMatch(word="AB", start=(0, 0), end=(0, 1))]
+
+    # A byte field only holds ASCII, so a non-ASCII word simply isn't there
+    assert Wordsearch(field).solve(["É", "AÉ", "AB"], engine=engine) == expected
+    assert Wordsearch(field, incremental=True).solve(["É", "AB"]) == expected
+    assert Wordsearch(field).query("É?") == []
+
+
+def test_generate_unsupported_dtype():
+    with pytest.raises(ValueError, match="Unsupported dtype"):
+        Wordsearch.generate(["FOO"], 5, 5, dtype="U2")
+
+
 def test_initialisation_ndim_error():
     field = numpy.ones(shape=(1, 2, 3), dtype="U1")
 
@@ -136,5 +324,356 @@ def test_solve():
     assert found == matches
     assert mock_find_all.call_count == len(words)
     for call, word in zip(mock_find_all.call_args_list, words):
-        args, _ = call
+        args, kwargs = call
         assert args == (word, field)
+        assert kwargs == {"line_index": wordsearch.line_index}
+
+
+def test_line_index_cached():
+    field = numpy.array([["A", "B"], ["C", "D"]], dtype="U1")
+    wordsearch = Wordsearch(field)
+
+    line_index = "wordsearch.wordsearch.LineIndex"
+    lines_from_field = "wordsearch.search.Lines.from_field"
+    with patch(line_index, wraps=LineIndex) as mock_line_index, \
+            patch(lines_from_field, wraps=Lines.from_field) as mock_lines_from_field:
+        wordsearch.solve(["AB", "CD", "AC", "BD", "AD", "BC"])
+
+    mock_line_index.assert_called_once_with(field)
+    # The text along each axis is built once, however many words are found
+    assert mock_lines_from_field.call_count == 4
+
+
+def test_line_index_invalidated():
+    wordsearch = Wordsearch(numpy.array([["A", "B"], ["C", "D"]], dtype="U1"))
+    assert wordsearch.line_index.lines((0, 1)).text == "ABCD"
+
+    wordsearch.field = numpy.array([["W", "X"], ["Y", "Z"]], dtype="U1")
+
+    assert wordsearch.line_index.lines((0, 1)).text == "WXYZ"
+
+
+def test_setitem_invalidates_line_index():
+    wordsearch = Wordsearch(numpy.array([["A", "B"], ["C", "D"]], dtype="U1"))
+    assert wordsearch.line_index.lines((0, 1)).text == "ABCD"
+
+    wordsearch[1, 0] = "X"
+
+    assert wordsearch.field[1, 0] == "X"
+    assert wordsearch.line_index.lines((0, 1)).text == "ABXD"
+
+
+def test_incremental_solve():
+    words = ["AA", "XA"]
+    field = numpy.array([["X", "A"], ["A", "X"]], dtype="U1")
+    wordsearch = Wordsearch(field.copy(), incremental=True)
+    assert wordsearch.solve(words) == Wordsearch(field).solve(words)
+
+    scan_line = IncrementalLineIndex._scan_line
+    with patch.object(IncrementalLineIndex, "_scan_line", autospec=True,
+                      side_effect=scan_line) as mock_scan_line:
+        wordsearch[1, 1] = "A"
+        field[1, 1] = "A"
+        matches = wordsearch.solve(words)
+
+    # The row text is now "XAAA", with an "AA" straddling the rows
+    assert matches == Wordsearch(field).solve(words)
+    assert len([match for match in matches if match.word == "AA"]) == 6
+    # Only the row, column, diagonal and antidiagonal through the cell
+    assert mock_scan_line.call_count == 4 * len(words)
+
+
+def test_wordsearch_place_word():
+    wordsearch = Wordsearch(numpy.full((3, 3), "", dtype="U1"), incremental=True)
+    assert wordsearch.solve(["CAT"]) == []
+    placement = Placement(word="CAT", start=(0, 2), direction=(1, -1))
+
+    with patch(get_compact_placement, return_value=placement):
+        assert wordsearch.place_word("CAT") == placement
+
+    assert "".join(wordsearch.field[[0, 1, 2], [2, 1, 0]]) == "CAT"
+    assert wordsearch.solve(["CAT"]) == [WordMatch(word="CAT", start=(0, 2), end=(2, 0))]
+
+
+def test_solve_cache():
+    field = numpy.array([["F", "O", "O"], ["O", "A", "A"], ["O", "A", "A"]], dtype="U1")
+    cache = SolveCache()
+    expected = Wordsearch(field).solve(["FOO", "AA", "FOO"])
+
+    assert Wordsearch(field).solve(["FOO", "AA", "FOO"], cache=cache) == expected
+    assert cache.stats.misses == 2
+
+    with patch("wordsearch.wordsearch.find_all") as mock_find_all:
+        matches = Wordsearch(field.copy()).solve(["AA", "FOO"], cache=cache)
+    mock_find_all.assert_not_called()
+    assert matches == Wordsearch(field).solve(["AA", "FOO"])
+    assert cache.stats.hits == 2
+
+    wordsearch = Wordsearch(field.copy())
+    wordsearch[0, 0] = "X"
+    assert wordsearch.solve(["FOO"], cache=cache) == wordsearch.solve(["FOO"])
+    assert cache.stats.misses == 3
+
+
+def test_generate_stats():
+    stats = Stats()
+    placements = [
+        Placement(word="FOO", start=(0, 0), direction=(0, 1)),
+        Placement(word="BAR", start=(0, 1), direction=(1, 0)),
+        Placement(word="BAR", start=(1, 0), direction=(0, 1)),
+    ]
+
+    with patch(get_compact_placement, side_effect=placements):
+        Wordsearch.generate(["FOO", "BAR"], 3, 3, stats=stats)
+
+    assert stats.placement_attempts == {"FOO": 1, "BAR": 2}
+    assert stats.placement_rejections == {"BAR": {(1, 0): 1}}
+    assert stats.fill_time > 0
+
+
+def test_solve_stats():
+    field = numpy.array([["F", "O", "O"], ["O", "A", "A"], ["O", "A", "A"]], dtype="U1")
+    wordsearch = Wordsearch(field)
+    stats = Stats()
+
+    matches = wordsearch.solve(["FOO", "AA"], stats=stats)
+
+    assert matches == wordsearch.solve(["FOO", "AA"])
+    assert sum(stats.scan_matches.values()) == len(matches)
+    assert stats.scan_matches[(0, 1)] == 3
+    assert set(stats.scan_time) == set(DIRECTIONS)
+    assert stats.solve_time >= sum(stats.scan_time.values())
+
+
+@pytest.mark.parametrize("engine", ["regex", "aho-corasick"])
+def test_solve_columnar(engine):
+    field = numpy.array([["F", "O", "O"], ["O", "A", "A"], ["O", "A", "A"]], dtype="U1")
+    wordsearch = Wordsearch(field)
+
+    matches = wordsearch.solve(["FOO", "AA", "BAR"], engine=engine, columnar=True)
+
+    assert [*matches] == wordsearch.solve(["FOO", "AA", "BAR"])
+    assert matches.words == ["FOO", "AA", "BAR"]
+    assert matches.word_counts().tolist() == [2, 12, 0]
+
+
+def test_solve_engine():
+    field = numpy.array([["F", "O", "O"], ["O", "A", "A"], ["O", "A", "A"]], dtype="U1")
+    wordsearch = Wordsearch(field)
+
+    matches = wordsearch.solve(["FOO", "AA"], engine="aho-corasick")
+
+    assert matches == wordsearch.solve(["FOO", "AA"])
+
+
+@pytest.mark.parametrize("engine", ["regex", "aho-corasick", "numpy", "literal", "anchored"])
+def test_solve_line_boundary(engine):
+    field = numpy.array([["X", "A"], ["A", "A"]], dtype="U1")
+    wordsearch = Wordsearch(field)
+
+    # The row text is "XAAA": the "AA" straddling the rows mustn't hide the one in the second
+    matches = wordsearch.solve(["AA"], engine=engine)
+
+    assert matches == [
+        WordMatch(word="AA", start=(1, 0), end=(1, 1)),
+        WordMatch(word="AA", start=(1, 1), end=(1, 0)),
+        WordMatch(word="AA", start=(0, 1), end=(1, 1)),
+        WordMatch(word="AA", start=(1, 1), end=(0, 1)),
+        WordMatch(word="AA", start=(0, 1), end=(1, 0)),
+        WordMatch(word="AA", start=(1, 0), end=(0, 1)),
+    ]
+
+
+def test_solve_unknown_engine():
+    wordsearch = Wordsearch(numpy.ones((1, 1), "U1"))
+
+    with pytest.raises(ValueError, match="Unknown engine"):
+        wordsearch.solve(["FOO"], engine="magic")
+
+
+def test_query():
+    field = numpy.array([["C", "A", "T"], ["O", "X", "A"], ["W", "O", "C"]], dtype="U1")
+    wordsearch = Wordsearch(field)
+
+    assert wordsearch.query("C?W") == [
+        WordMatch(word="COW", start=(2, 2), end=(2, 0)),
+        WordMatch(word="COW", start=(0, 0), end=(2, 0))
+    ]
+    assert wordsearch.query("CAT") == wordsearch.solve(["CAT"])
+    assert wordsearch.line_index._masks
+
+
+def test_discover():
+    field = numpy.array([["C", "A", "T"], ["O", "X", "A"], ["W", "O", "C"]], dtype="U1")
+    wordsearch = Wordsearch(field)
+
+    matches = [*wordsearch.discover(["CAT", "COW", "TAC", "DOG", "OX"], min_length=3)]
+
+    assert sorted(matches) == sorted([
+        WordMatch(word="CAT", start=(0, 0), end=(0, 2)),
+        WordMatch(word="TAC", start=(0, 2), end=(0, 0)),
+        WordMatch(word="COW", start=(0, 0), end=(2, 0)),
+        WordMatch(word="COW", start=(2, 2), end=(2, 0)),
+        WordMatch(word="CAT", start=(2, 2), end=(0, 2)),
+        WordMatch(word="TAC", start=(0, 2), end=(2, 2)),
+    ])
+
+
+def test_from_file(tmp_path):
+    path = tmp_path / "field.bin"
+    path.write_bytes(b"FOOXXBARXX")
+
+    wordsearch = Wordsearch.from_file(path, (2, 5))
+
+    assert wordsearch.field.dtype == "S1"
+    assert wordsearch.field.shape == (2, 5)
+    assert [*wordsearch.iter_solve_banded(["FOO", "BAR"], band_size=2)] == [
+        WordMatch(word="FOO", start=(0, 0), end=(0, 2)),
+        WordMatch(word="BAR", start=(1, 0), end=(1, 2)),
+    ]
+
+
+def test_iter_solve():
+    field = numpy.array([["F", "O", "O"], ["O", "A", "B"], ["O", "B", "A"]], dtype="U1")
+    wordsearch = Wordsearch(field)
+
+    matches = wordsearch.iter_solve(["FOO", "AB"])
+
+    assert next(matches) == WordMatch(word="FOO", start=(0, 0), end=(0, 2))
+    assert [*matches] == wordsearch.solve(["FOO", "AB"])[1:]
+
+
+def test_first_match():
+    field = numpy.array([["F", "O", "O"], ["O", "A", "B"], ["O", "B", "A"]], dtype="U1")
+    wordsearch = Wordsearch(field)
+
+    assert wordsearch.first_match("AB") == WordMatch(word="AB", start=(1, 1), end=(1, 2))
+    assert wordsearch.first_match("ZZ") is None
+
+
+def test_contains_stops_early():
+    field = numpy.array([["F", "O", "O"], ["A", "A", "A"]], dtype="U1")
+    wordsearch = Wordsearch(field)
+
+    assert wordsearch.contains("FOO")
+    assert not wordsearch.contains("BAR")
+
+    # Found left-to-right, so no other lines of the field are ever built
+    wordsearch = Wordsearch(field)
+    assert wordsearch.contains("FOO")
+    assert [*wordsearch.line_index._lines] == [(0, 1)]
+
+
+def test_generate_rng():
+    fields = [
+        Wordsearch.generate(["FOO", "BAR"], 6, 6, rng=numpy.random.default_rng(3)).field
+        for _ in range(2)
+    ]
+
+    assert (fields[0] == fields[1]).all()
+
+
+def test_generate_many():
+    specs = [
+        {"words": ["FOO", "BAR"], "width": 5, "height": 5},
+        {"words": ["BAZ"], "width": 4, "height": 3, "placement": "enumerate"},
+        {"words": ["QUX"], "width": 6, "height": 6, "strategy": "backtrack"},
+    ]
+
+    serial = [*Wordsearch.generate_many(specs, seed=42)]
+    parallel = [*Wordsearch.generate_many(specs, workers=2, seed=42, chunksize=1)]
+    reseeded = [*Wordsearch.generate_many(specs, seed=43)]
+
+    assert [wordsearch.field.shape for wordsearch in serial] == [(5, 5), (3, 4), (6, 6)]
+    for expected, wordsearch in zip(serial, parallel):
+        assert (wordsearch.field == expected.field).all()
+    assert any((a.field != b.field).any() for a, b in zip(serial, reseeded))
+    assert serial[1].contains("BAZ")
+
+
+@pytest.mark.parametrize("engine", ["regex", "literal"])
+def test_solve_many(engine):
+    fields = [
+        Wordsearch.generate(["FOO", "BAR"], 6, 6, rng=numpy.random.default_rng(seed)).field
+        for seed in range(5)
+    ]
+    fields.append(fields[0].astype("S1"))
+    puzzles = [(field, ["FOO", "BAR", "FOO", "BAZ"]) for field in fields]
+
+    serial = [*solve_many(puzzles, engine=engine)]
+    parallel = [*solve_many(puzzles, workers=2, engine=engine, chunksize=2)]
+
+    assert serial == parallel
+    assert serial[0] == Wordsearch(fields[0]).solve(["FOO", "BAR", "FOO", "BAZ"], engine=engine)
+    assert serial[-1] == serial[0]
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_solve_many_errors(workers):
+    field = numpy.array([["F", "O", "O"]], dtype="U1")
+    puzzles = [(field, ["+A"]), (field, ["FOO"])]
+
+    results = [*solve_many(puzzles, workers=workers, errors=(re.error,))]
+
+    assert isinstance(results[0], re.error)
+    assert results[1] == [WordMatch(word="FOO", start=(0, 0), end=(0, 2))]
+    with pytest.raises(re.error):
+        [*solve_many(puzzles, workers=workers)]
+
+
+def test_match_records():
+    words = ["FOO", "BAR", "FOO"]
+    matches = [
+        WordMatch(word="BAR", start=(0, 0), end=(0, 2)),
+        WordMatch(word="FOO", start=(3, 1), end=(1, 1)),
+    ]
+
+    assert index_words(words) == {"FOO": 0, "BAR": 1}
+    records = to_match_records(matches, words)
+    assert records == [(1, 0, 0, 0, 2), (0, 3, 1, 1, 1)]
+    assert from_match_records(records, words) == matches
+
+
+@pytest.mark.parametrize("engine", ["regex", "aho-corasick", "numpy", "literal", "anchored"])
+def test_solve_workers(engine):
+    words = ["ABC", "CAB", "BC", "C", "AA", "ABC"]
+    field = numpy.random.default_rng(5).choice([*"ABC"], (13, 11)).astype("U1")
+    wordsearch = Wordsearch(field)
+
+    matches = wordsearch.solve(words, engine=engine, workers=2, band_size=4)
+
+    assert matches == wordsearch.solve(words, engine=engine)
+    assert matches == wordsearch.solve(words, engine=engine, workers=2, band_size=5)
+    assert matches == wordsearch.solve(words, engine=engine, workers=2)
+
+
+@pytest.mark.parametrize(("engine", "expected_count"), [("regex", 2), ("literal", 4)])
+def test_solve_workers_overlapping(engine, expected_count):
+    wordsearch = Wordsearch(numpy.array([["A", "A", "A"]], dtype="U1"))
+
+    # Tiles of one cell each find one "AA" each way, which the regex engine wouldn't report
+    matches = wordsearch.solve(["AA"], engine=engine, workers=2, band_size=1)
+
+    assert matches == wordsearch.solve(["AA"], engine=engine)
+    assert len(matches) == expected_count
+
+
+def test_solve_workers_regex_pattern():
+    wordsearch = Wordsearch(numpy.array([["A", "X", "B"]], dtype="U1"))
+    assert wordsearch.solve(["A.B"]) == [WordMatch(word="A.B", start=(0, 0), end=(0, 2))]
+
+    # Tiles match words literally, so they can't find what the pattern does
+    with pytest.raises(ValueError, match="regex pattern: A.B"):
+        wordsearch.solve(["AX", "A.B"], workers=2)
+
+    assert wordsearch.solve(["A.B"], engine="literal", workers=2) == []
+
+
+def test_solve_workers_band_size():
+    wordsearch = Wordsearch(numpy.full((40, 40), "A", dtype="U1"))
+
+    with patch("wordsearch.wordsearch.iter_tiles", wraps=iter_tiles) as mock_iter_tiles:
+        wordsearch.solve(["AB"], workers=2)
+
+    # Each of the workers gets several tiles, rather than one tile covering the field
+    mock_iter_tiles.assert_called_once_with((40, 40), 14, 1)
@@ -1,9 +1,12 @@
+from functools import wraps
+
 from numpy.random import get_state, set_state, seed as set_seed
 
 
 def fix_random_seed(seed=1234):
     """Fix numpy random seed for decorated function."""
     def decorator(func):
+        @wraps(func)
         def wrapper(*args, **kwargs):
             initial_state = get_state()
             set_seed(seed)
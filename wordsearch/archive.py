@@ -0,0 +1,130 @@
+import json
+
+import numpy
+
+from wordsearch.placements import placement_from_list, placement_to_list
+from wordsearch.wordsearch import Wordsearch
+
+
+MAGIC = b"WSARCHV1"
+
+HEADER_DTYPE = numpy.dtype([("count", "<u8"), ("index_offset", "<u8")])
+
+INDEX_DTYPE = numpy.dtype([
+    ("offset", "<u8"),
+    ("height", "<u4"),
+    ("width", "<u4"),
+    ("dtype", "<u8"),
+    ("metadata_offset", "<u8"),
+    ("metadata_length", "<u8"),
+])
+
+# Field dtypes an archive can hold, stored in the index by position
+FIELD_DTYPES = (numpy.dtype("<U1"), numpy.dtype("S1"), numpy.dtype(numpy.uint8))
+
+# Grids are padded to start at multiples of this many bytes
+ALIGNMENT = 8
+
+
+def get_metadata(wordsearch):
+    """Get the words and placements of 'wordsearch' as JSON-encoded bytes."""
+    placements = wordsearch.placements
+    if placements is not None:
+        placements = [placement_to_list(placement) for placement in placements]
+    metadata = {"words": wordsearch.words, "placements": placements}
+    return json.dumps(metadata, separators=(",", ":")).encode("utf-8")
+
+
+def save_archive(path, wordsearches):
+    """Write each of 'wordsearches' into a single archive file at 'path'.
+
+    Each field is stored as its raw cells, one byte per cell for byte
+    fields and four for U1 fields, followed by its words and placements as
+    JSON. An index of where each one starts is written at the end.
+    'wordsearches' may be a generator, as only the index is held in memory.
+    Returns the number of wordsearches written.
+    """
+    index = []
+    with open(path, "wb") as archive:
+        archive.write(MAGIC)
+        archive.write(numpy.zeros(1, HEADER_DTYPE).tobytes())
+        for wordsearch in wordsearches:
+            field = numpy.ascontiguousarray(wordsearch.field)
+            try:
+                dtype = FIELD_DTYPES.index(field.dtype)
+            except ValueError:
+                raise ValueError(f"Unsupported dtype: {field.dtype}") from None
+
+            archive.write(bytes(-archive.tell() % ALIGNMENT))
+            offset = archive.tell()
+            archive.write(field.tobytes())
+            metadata = get_metadata(wordsearch)
+            metadata_offset = archive.tell()
+            archive.write(metadata)
+            height, width = field.shape
+            index.append((offset, height, width, dtype, metadata_offset, len(metadata)))
+
+        archive.write(bytes(-archive.tell() % ALIGNMENT))
+        index_offset = archive.tell()
+        archive.write(numpy.array(index, INDEX_DTYPE).tobytes())
+        archive.seek(len(MAGIC))
+        archive.write(numpy.array([(len(index), index_offset)], HEADER_DTYPE).tobytes())
+    return len(index)
+
+
+class Archive:
+    """Wordsearches in an archive file written by save_archive.
+
+    The file is memory-mapped read-only, so only the cells of the fields
+    accessed are read from disk. archive[i] gives a Wordsearch whose field
+    is a view of the file, with its 'words' and 'placements' restored.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._buffer = numpy.memmap(path, dtype=numpy.uint8, mode="r")
+        header_end = len(MAGIC) + HEADER_DTYPE.itemsize
+        if self._buffer[:len(MAGIC)].tobytes() != MAGIC:
+            raise ValueError(f"Not a wordsearch archive: {path}")
+        header = self._buffer[len(MAGIC):header_end].view(HEADER_DTYPE)[0]
+        index_offset = int(header["index_offset"])
+        index_end = index_offset + int(header["count"]) * INDEX_DTYPE.itemsize
+        self.index = self._buffer[index_offset:index_end].view(INDEX_DTYPE)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self[position]
+
+    def __getitem__(self, position):
+        wordsearch = Wordsearch(self.field(position))
+        metadata = self.metadata(position)
+        wordsearch.words = metadata["words"]
+        if metadata["placements"] is not None:
+            wordsearch.placements = [
+                placement_from_list(item) for item in metadata["placements"]
+            ]
+        return wordsearch
+
+    def field(self, position):
+        """Get a read-only view of the field at 'position', without copying it."""
+        entry = self.index[range(len(self))[position]]
+        dtype = FIELD_DTYPES[entry["dtype"]]
+        shape = (int(entry["height"]), int(entry["width"]))
+        start = int(entry["offset"])
+        end = start + shape[0] * shape[1] * dtype.itemsize
+        return self._buffer[start:end].view(dtype).reshape(shape)
+
+    def metadata(self, position):
+        """Get the dict of words and placements stored at 'position'."""
+        entry = self.index[range(len(self))[position]]
+        start = int(entry["metadata_offset"])
+        end = start + int(entry["metadata_length"])
+        return json.loads(self._buffer[start:end].tobytes().decode("utf-8"))
+
+
+def open_archive(path):
+    """Open the archive file at 'path' written by save_archive."""
+    return Archive(path)
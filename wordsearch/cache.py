@@ -0,0 +1,99 @@
+import hashlib
+import sys
+
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+import numpy
+
+
+CacheStats = namedtuple("CacheStats", ("hits", "misses", "evictions", "entries", "size"))
+
+
+def fingerprint_field(field):
+    """Get a hash of the contents, dtype and shape of 'field'."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{field.dtype.str}{field.shape}".encode("ascii"))
+    digest.update(numpy.ascontiguousarray(field).data)
+    return digest.digest()
+
+
+def estimate_size(matches):
+    """Estimate the bytes of memory held by a tuple of WordMatch 'matches'."""
+    size = sys.getsizeof(matches)
+    for match in matches:
+        size += sys.getsizeof(match) + sys.getsizeof(match.start) + sys.getsizeof(match.end)
+    return size
+
+
+class SolveCache:
+    """Least-recently-used store of the matches found for each word in a field.
+
+    Entries are keyed on a field fingerprint, a solve engine and a word. The
+    least recently used entries are evicted once there are more than
+    'max_entries' of them, or their estimated size passes 'max_size' bytes.
+    Either limit may be None to leave it unbounded.
+    """
+
+    def __init__(self, max_entries=1024, max_size=None):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Get the matches stored for 'key', or None if there are none."""
+        with self._lock:
+            matches = self._entries.get(key)
+            if matches is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._entries.move_to_end(key)
+            return matches
+
+    def put(self, key, matches):
+        """Store the tuple of 'matches' for 'key', evicting old entries if needed."""
+        size = estimate_size(matches)
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._sizes.pop(key)
+                del self._entries[key]
+            self._entries[key] = matches
+            self._sizes[key] = size
+            self._size += size
+            while self._entries and self._over_limit():
+                evicted, _ = self._entries.popitem(last=False)
+                self._size -= self._sizes.pop(evicted)
+                self._evictions += 1
+
+    def _over_limit(self):
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_size is not None and self._size > self.max_size
+
+    def clear(self):
+        """Remove every entry, keeping the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._size = 0
+
+    @property
+    def stats(self):
+        """CacheStats of the hits, misses and evictions so far and the current contents."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            size=self._size
+        )
@@ -0,0 +1,207 @@
+import argparse
+import json
+import re
+import sys
+
+from collections import deque, namedtuple
+
+import numpy
+
+from wordsearch.parallel import imap_ordered
+from wordsearch.placements import placement_to_list
+from wordsearch.search import SOLVE_ENGINES
+from wordsearch.wordsearch import (
+    PlacementError,
+    Wordsearch,
+    WordsearchInitialisationError,
+    generate_seeded,
+    iter_seeded,
+    solve_many,
+    to_unicode_field
+)
+
+# Errors from a spec that can't be generated, reported without stopping the stream
+GENERATE_ERRORS = (
+    PlacementError, WordsearchInitialisationError, AssertionError, TypeError, ValueError
+)
+
+# Errors from a puzzle that can't be read or solved, reported the same way
+PUZZLE_ERRORS = (TypeError, ValueError, WordsearchInitialisationError)
+SOLVE_ERRORS = (re.error, TypeError, ValueError, WordsearchInitialisationError)
+
+
+class InvalidRecord(namedtuple("InvalidRecord", ("error",))):
+    """Stand-in for a line that isn't valid JSON, holding the 'error' to report."""
+
+    __slots__ = ()
+
+
+def iter_records(lines):
+    """Yield the JSON value on each non-blank line of 'lines'.
+
+    A line that isn't valid JSON gives an InvalidRecord in its place, so
+    the error can be reported in order.
+    """
+    for line in lines:
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as error:
+                yield InvalidRecord(error=f"Invalid JSON: {error}")
+
+
+def field_to_rows(field):
+    """Get 'field' as a list of strings, one per row."""
+    if field.dtype != numpy.dtype("<U1"):
+        field = to_unicode_field(field)
+    return ["".join(row) for row in field]
+
+
+def rows_to_field(rows):
+    """Get a U1 field from a list of strings, one per row."""
+    return numpy.array([[*row] for row in rows], dtype="U1")
+
+
+def read_puzzle(puzzle):
+    """Get the (field, words) of a puzzle record, raising one of PUZZLE_ERRORS if it's invalid."""
+    if isinstance(puzzle, InvalidRecord):
+        raise ValueError(puzzle.error)
+    try:
+        rows, words = puzzle["field"], puzzle["words"]
+    except KeyError as error:
+        raise ValueError(f"Missing key: {error}") from None
+    if len({len(row) for row in rows}) > 1:
+        raise ValueError("Rows must all be the same length")
+    field = Wordsearch(rows_to_field(rows)).field
+    if not field.size:
+        raise ValueError("Field is empty")
+    return field, [*words]
+
+
+def _generate_record(job):
+    """Generate a wordsearch from a (spec, SeedSequence) job as a JSON-ready dict."""
+    spec, seed_sequence = job
+    if isinstance(spec, InvalidRecord):
+        return {"error": spec.error}
+    try:
+        wordsearch = generate_seeded(Wordsearch, spec, seed_sequence)
+    except GENERATE_ERRORS as error:
+        return {"error": str(error)}
+    return {
+        "field": field_to_rows(wordsearch.field),
+        "words": wordsearch.words,
+        "placements": [placement_to_list(placement) for placement in wordsearch.placements]
+    }
+
+
+def generate_records(specs, workers=None, seed=None, chunksize=8):
+    """Yield a dict describing a wordsearch generated from each of 'specs', in order.
+
+    Each spec is a dict of keyword arguments for Wordsearch.generate, given
+    its own random state from 'seed' as in Wordsearch.generate_many. Specs
+    that can't be generated, such as those with unknown arguments or words
+    that can't be placed, give a dict with an "error" instead.
+    """
+    jobs = iter_seeded(specs, seed)
+    yield from imap_ordered(_generate_record, jobs, workers=workers, chunksize=chunksize)
+
+
+def solve_records(puzzles, workers=None, engine="regex", chunksize=1):
+    """Yield a dict of the matches found in each of 'puzzles', in order.
+
+    Each puzzle is a dict holding its "field" as a list of rows and the
+    "words" to find. Puzzles that can't be read or solved, such as those
+    with ragged rows or words that aren't valid for 'engine', give a dict
+    with an "error" instead.
+    """
+    # An error for each puzzle read, or None for those passed on to be solved
+    read_errors = deque()
+
+    def iter_puzzles():
+        for puzzle in puzzles:
+            try:
+                field, words = read_puzzle(puzzle)
+            except PUZZLE_ERRORS as error:
+                read_errors.append({"error": str(error)})
+                continue
+            read_errors.append(None)
+            yield field, words
+
+    results = solve_many(iter_puzzles(), workers=workers, engine=engine,
+                         chunksize=chunksize, errors=SOLVE_ERRORS)
+    for matches in results:
+        while read_errors[0] is not None:
+            yield read_errors.popleft()
+        read_errors.popleft()
+        if isinstance(matches, Exception):
+            yield {"error": str(matches)}
+            continue
+        yield {
+            "matches": [
+                {"word": match.word, "start": [*match.start], "end": [*match.end]}
+                for match in matches
+            ]
+        }
+    yield from read_errors
+
+
+def write_records(records, output):
+    """Write each of 'records' to 'output' as a line of JSON, as it's produced."""
+    for record in records:
+        output.write(json.dumps(record, separators=(",", ":")))
+        output.write("\n")
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        prog="wordsearch", description="Generate or solve wordsearches in bulk, as JSON lines."
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("input", nargs="?", type=argparse.FileType("r", encoding="utf-8"),
+                        default="-", help="File to read JSON lines from, stdin by default")
+    common.add_argument("-o", "--output", type=argparse.FileType("w", encoding="utf-8"),
+                        default="-", help="File to write JSON lines to, stdout by default")
+    common.add_argument("-w", "--workers", type=int,
+                        help="Number of worker processes, none by default")
+
+    generate = subparsers.add_parser(
+        "generate", parents=[common],
+        help="Generate a wordsearch for each line of keyword arguments for generate"
+    )
+    generate.add_argument("--seed", type=int, help="Seed for reproducible output")
+    generate.add_argument("--chunksize", type=int, default=8,
+                          help="Number of specs sent to a worker at once")
+
+    solve = subparsers.add_parser(
+        "solve", parents=[common],
+        help='Solve each line of {"field": [rows], "words": [words]}'
+    )
+    solve.add_argument("--engine", choices=sorted(SOLVE_ENGINES), default="regex")
+    solve.add_argument("--chunksize", type=int, default=1,
+                       help="Number of puzzles sent to a worker at once")
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    records = iter_records(args.input)
+    if args.command == "generate":
+        results = generate_records(
+            records, workers=args.workers, seed=args.seed, chunksize=args.chunksize
+        )
+    else:
+        results = solve_records(
+            records, workers=args.workers, engine=args.engine, chunksize=args.chunksize
+        )
+    try:
+        write_records(results, args.output)
+    finally:
+        args.output.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
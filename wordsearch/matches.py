@@ -0,0 +1,116 @@
+from itertools import islice
+
+import numpy
+
+from wordsearch.search import DIRECTIONS, WordMatch, get_direction_index
+
+
+MATCH_DTYPE = numpy.dtype([
+    ("word", numpy.int32),
+    ("start_row", numpy.int32),
+    ("start_column", numpy.int32),
+    ("end_row", numpy.int32),
+    ("end_column", numpy.int32),
+    ("direction", numpy.int32),
+])
+
+# Matches converted at a time by MatchArray.from_matches
+CHUNK_SIZE = 65536
+
+
+class MatchArray:
+    """WordMatch results stored as columns of int32 in a structured array.
+
+    'records' has a row of MATCH_DTYPE for each match, where "word" is an
+    index into 'words' and "direction" an index into DIRECTIONS. Iterating
+    yields a WordMatch for each row, so a MatchArray can be used in place
+    of a list of them, while the columns of 'records' can be used directly
+    for counting and other array operations.
+    """
+
+    __slots__ = ("words", "records")
+
+    def __init__(self, words, records):
+        self.words = words
+        self.records = records
+
+    @classmethod
+    def from_matches(cls, matches, words=None):
+        """Build a MatchArray from an iterable of WordMatch 'matches'.
+
+        Each word is stored as the index of its first occurrence in 'words'.
+        Without 'words', they're listed in the order they're first matched.
+        'matches' are converted a chunk at a time, so they may be a
+        generator too large to hold as WordMatch objects at once.
+        """
+        words = [] if words is None else [*words]
+        word_indices = {}
+        for index, word in enumerate(words):
+            word_indices.setdefault(word, index)
+
+        chunks = []
+        iterator = iter(matches)
+        chunk = [*islice(iterator, CHUNK_SIZE)]
+        while chunk:
+            rows = []
+            for match in chunk:
+                if match.word not in word_indices:
+                    word_indices[match.word] = len(words)
+                    words.append(match.word)
+                rows.append(
+                    (word_indices[match.word], *match.start, *match.end,
+                     get_direction_index(match))
+                )
+            chunks.append(numpy.array(rows, dtype=MATCH_DTYPE))
+            chunk = [*islice(iterator, CHUNK_SIZE)]
+        records = numpy.concatenate(chunks) if chunks else numpy.empty(0, MATCH_DTYPE)
+        return cls(words, records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        for record in self.records.tolist():
+            yield self._as_word_match(record)
+
+    def __getitem__(self, index):
+        """Get the WordMatch at an integer 'index', or a MatchArray of those selected."""
+        if isinstance(index, (int, numpy.integer)):
+            return self._as_word_match(self.records[index].tolist())
+        return MatchArray(self.words, self.records[index])
+
+    def __repr__(self):
+        return f"MatchArray({len(self)} matches of {len(self.words)} words)"
+
+    def _as_word_match(self, record):
+        word_index, start_row, start_column, end_row, end_column, _ = record
+        return WordMatch(
+            word=self.words[word_index],
+            start=(start_row, start_column),
+            end=(end_row, end_column)
+        )
+
+    def word_counts(self):
+        """Get an array of the number of matches of each of 'words'."""
+        return numpy.bincount(self.records["word"], minlength=len(self.words))
+
+    def coverage(self, shape):
+        """Get an array of 'shape' counting the matches covering each cell."""
+        records = self.records
+        lengths = numpy.array([len(word) for word in self.words], dtype=numpy.int64)
+        lengths = lengths[records["word"]]
+        steps = numpy.array(DIRECTIONS)[records["direction"]]
+
+        # Offset of each covered cell along its match
+        firsts = numpy.repeat(numpy.cumsum(lengths) - lengths, lengths)
+        positions = numpy.arange(lengths.sum()) - firsts
+        rows = numpy.repeat(records["start_row"], lengths) + (
+            numpy.repeat(steps[:, 0], lengths) * positions
+        )
+        columns = numpy.repeat(records["start_column"], lengths) + (
+            numpy.repeat(steps[:, 1], lengths) * positions
+        )
+
+        coverage = numpy.zeros(shape, dtype=numpy.int64)
+        numpy.add.at(coverage, (rows, columns), 1)
+        return coverage
@@ -0,0 +1,72 @@
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy
+
+
+SharedArray = namedtuple("SharedArray", ("name", "shape", "dtype"))
+
+
+def _map_chunk(func, chunk):
+    return [func(item) for item in chunk]
+
+
+def iter_chunks(iterable, chunksize):
+    """Yield lists of up to 'chunksize' consecutive items of 'iterable'."""
+    iterator = iter(iterable)
+    chunk = [*islice(iterator, chunksize)]
+    while chunk:
+        yield chunk
+        chunk = [*islice(iterator, chunksize)]
+
+
+def imap_ordered(func, iterable, workers=None, chunksize=1, max_pending=None):
+    """Yield func(item) for each item of 'iterable', in order.
+
+    With 'workers', items are sent in chunks of 'chunksize' to a pool of that
+    many processes. At most 'max_pending' chunks, by default twice the
+    number of workers, are in flight at once, so 'iterable' is consumed
+    lazily and memory stays bounded however long it is. Without 'workers',
+    items are processed one at a time in this process.
+    """
+    if not workers:
+        yield from map(func, iterable)
+        return
+
+    max_pending = max_pending or 2 * workers
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        for chunk in iter_chunks(iterable, chunksize):
+            pending.append(executor.submit(_map_chunk, func, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def share_array(array):
+    """Copy 'array' into a new shared memory block.
+
+    Returns the SharedMemory, which the caller must close and unlink once
+    done with it, and a picklable SharedArray referring to it.
+    """
+    shared_memory = SharedMemory(create=True, size=max(array.nbytes, 1))
+    shared = SharedArray(name=shared_memory.name, shape=array.shape, dtype=array.dtype.str)
+    numpy.ndarray(array.shape, array.dtype, buffer=shared_memory.buf)[...] = array
+    return shared_memory, shared
+
+
+@contextmanager
+def attach_array(shared):
+    """Attach to the block of a SharedArray, yielding it as an array without copying.
+
+    The array mustn't be used after the context exits.
+    """
+    shared_memory = SharedMemory(name=shared.name)
+    try:
+        yield numpy.ndarray(shared.shape, shared.dtype, buffer=shared_memory.buf)
+    finally:
+        shared_memory.close()
@@ -1,49 +1,179 @@
 import numpy
 
+from collections import namedtuple
 from numpy.random import randint, choice
 
+from wordsearch.search import AXES, DIRECTIONS, field_codes, get_windows
 
-def get_standard_placement(word, field_width, field_height):
+
+def random_integer(low, high, rng=None):
+    """Draw an integer from [low, high) using 'rng', or numpy's global random state."""
+    if rng is None:
+        return randint(low, high)
+    return rng.integers(low, high)
+
+
+def random_choice(options, rng=None):
+    """Draw one of 'options' using 'rng', or numpy's global random state.
+
+    As with numpy, an integer 'options' draws from range(options).
+    """
+    if rng is None:
+        return choice(options)
+    return rng.choice(options)
+
+
+def get_standard_placement(word, field_width, field_height, rng=None):
     """Get a traditional, left-right, reading word placement."""
     word_length = len(word)
     placement = numpy.full((field_height, field_width), None)
-    row = randint(0, field_height - 1)
+    row = random_integer(0, field_height - 1, rng=rng)
     max_start_column = field_width - word_length
-    start_column = randint(0, max_start_column) if max_start_column else 0
+    start_column = random_integer(0, max_start_column, rng=rng) if max_start_column else 0
     placement[row, start_column:start_column + word_length] = [*word]
     return placement
 
 
-def get_reversed_placement(word, field_width, field_height):
+def get_reversed_placement(word, field_width, field_height, rng=None):
     """Get a horizontal placement, but with word reading from right-left."""
     reversed_word = "".join(reversed(word))
-    return get_standard_placement(reversed_word, field_width, field_height)
+    return get_standard_placement(reversed_word, field_width, field_height, rng=rng)
 
 
-def get_vertical_placement(word, field_width, field_height):
+def get_vertical_placement(word, field_width, field_height, rng=None):
     """Get a placement with word reading vertically."""
-    placement = get_standard_placement(word, field_height, field_width)
+    placement = get_standard_placement(word, field_height, field_width, rng=rng)
     return placement.T
 
 
-def get_reversed_vertical_placement(word, field_width, field_height):
+def get_reversed_vertical_placement(word, field_width, field_height, rng=None):
     """Get a placement with word reading vertically, from bottom-top."""
-    placement = get_reversed_placement(word, field_height, field_width)
+    placement = get_reversed_placement(word, field_height, field_width, rng=rng)
     return placement.T
 
 
+def get_diagonal_placement(word, field_width, field_height, rng=None):
+    """Get a placement with word reading diagonally, from top-left to bottom-right."""
+    word_length = len(word)
+    placement = numpy.full((field_height, field_width), None)
+    start_row = random_integer(0, field_height - word_length + 1, rng=rng)
+    start_column = random_integer(0, field_width - word_length + 1, rng=rng)
+    diagonal = numpy.arange(word_length)
+    placement[start_row + diagonal, start_column + diagonal] = [*word]
+    return placement
+
+
+def get_reversed_diagonal_placement(word, field_width, field_height, rng=None):
+    """Get a diagonal placement, but with word reading from bottom-right to top-left."""
+    reversed_word = "".join(reversed(word))
+    return get_diagonal_placement(reversed_word, field_width, field_height, rng=rng)
+
+
+def get_antidiagonal_placement(word, field_width, field_height, rng=None):
+    """Get a placement with word reading diagonally, from top-right to bottom-left."""
+    placement = get_diagonal_placement(word, field_width, field_height, rng=rng)
+    return numpy.fliplr(placement)
+
+
+def get_reversed_antidiagonal_placement(word, field_width, field_height, rng=None):
+    """Get a placement with word reading diagonally, from bottom-left to top-right."""
+    placement = get_reversed_diagonal_placement(word, field_width, field_height, rng=rng)
+    return numpy.fliplr(placement)
+
+
 PLACEMENT_FUNCTIONS = [
     get_standard_placement,
     get_reversed_placement,
     get_vertical_placement,
-    get_reversed_vertical_placement
+    get_reversed_vertical_placement,
+    get_diagonal_placement,
+    get_reversed_diagonal_placement,
+    get_antidiagonal_placement,
+    get_reversed_antidiagonal_placement
 ]
 
 
-def get_placement(word, field_width, field_height):
+def get_placement(word, field_width, field_height, rng=None):
     """Get a randomly-chosen placement for given 'word'."""
-    placement_function = choice(PLACEMENT_FUNCTIONS)
-    return placement_function(word, field_width, field_height)
+    placement_function = random_choice(PLACEMENT_FUNCTIONS, rng=rng)
+    return placement_function(word, field_width, field_height, rng=rng)
+
+
+class Placement(namedtuple("Placement", ("word", "start", "direction"))):
+    """Compact placement of 'word', reading from 'start' in 'direction'.
+
+    'start' is the (row, column) of the first letter and 'direction' is one
+    of DIRECTIONS.
+    """
+
+    __slots__ = ()
+
+    def coordinates(self):
+        """Get the (rows, columns) of the cells this placement covers."""
+        return get_word_coordinates(len(self.word), self.start, self.direction)
+
+
+def placement_to_list(placement):
+    """Get 'placement' as a JSON-ready [word, [row, column], [row step, column step]] list."""
+    return [placement.word, [int(index) for index in placement.start], [*placement.direction]]
+
+
+def placement_from_list(item):
+    """Get the Placement described by a list from placement_to_list."""
+    word, start, direction = item
+    return Placement(word=word, start=tuple(start), direction=tuple(direction))
+
+
+def get_compact_placement(word, field_width, field_height, rng=None):
+    """Get a randomly-chosen Placement for given 'word'.
+
+    Orientations and positions are drawn exactly as get_placement draws
+    them, but without building a full-field array. 'rng' is a
+    numpy.random.Generator, or None to use numpy's global random state.
+    """
+    word_length = len(word)
+    extent = word_length - 1
+    direction = DIRECTIONS[random_choice(len(PLACEMENT_FUNCTIONS), rng=rng)]
+    row_step, column_step = direction
+    reverse = direction not in AXES
+    if not row_step or not column_step:
+        if row_step:
+            line_count, line_length = field_width, field_height
+        else:
+            line_count, line_length = field_height, field_width
+        line = random_integer(0, line_count - 1, rng=rng)
+        max_start = line_length - word_length
+        position = random_integer(0, max_start, rng=rng) if max_start else 0
+        if reverse:
+            position += extent
+        start = (position, line) if row_step else (line, position)
+    else:
+        row = random_integer(0, field_height - word_length + 1, rng=rng)
+        column = random_integer(0, field_width - word_length + 1, rng=rng)
+        if reverse:
+            row, column = row + extent, column + extent
+        if row_step != column_step:
+            column = field_width - 1 - column
+        start = (row, column)
+    return Placement(word=word, start=start, direction=direction)
+
+
+def compact_placement_is_valid(placement, field):
+    """Check if given compact 'placement' is compatible with 'field'.
+
+    Follows the same rules as placement_is_valid, but only the cells the
+    placement covers are inspected.
+    """
+    cells = field[placement.coordinates()]
+    occupied = cells.astype(bool)
+    letters = numpy.array([*placement.word])
+    return (cells[occupied] == letters[occupied]).all()
+
+
+def write_placement(placement, field):
+    """Write the word of 'placement' into 'field'."""
+    field[placement.coordinates()] = [*placement.word]
+    return field
 
 
 def placement_is_valid(placement, field):
@@ -62,3 +192,49 @@ def placement_is_valid(placement, field):
     overlaps = placement_bool & field_bool
     allowed_overlaps = placement == field
     return allowed_overlaps[numpy.where(overlaps)].all()
+
+
+def occupancy_codes(field):
+    """Get 'field' as uint32 codepoints, with 0 marking empty cells.
+
+    Arrays that are already uint32 codepoints are returned unchanged.
+    """
+    if field.dtype == numpy.uint32:
+        return field
+    if field.dtype == object:
+        field = numpy.where(field.astype(bool), field, "").astype("U1")
+    return field_codes(field)
+
+
+def get_word_coordinates(word_length, start, direction):
+    """Get the (rows, columns) covered by a word placed at 'start' in 'direction'."""
+    row, column = start
+    row_step, column_step = direction
+    steps = numpy.arange(word_length)
+    return row + row_step * steps, column + column_step * steps
+
+
+def get_placement_candidates(word, field):
+    """Get every start and direction at which 'word' is compatible with 'field'.
+
+    Every run of cells in each of DIRECTIONS is compared against the word
+    at once. Returns arrays of (rows, columns, directions), where each
+    direction is an index into DIRECTIONS.
+    """
+    codes = occupancy_codes(field)
+    word_codes = field_codes(numpy.array([*word], dtype="U1"))
+    extent = len(word) - 1
+    candidates = []
+    for direction_index, (row_step, column_step) in enumerate(DIRECTIONS):
+        reverse = (row_step, column_step) not in AXES
+        axis = (-row_step, -column_step) if reverse else (row_step, column_step)
+        target = word_codes[::-1] if reverse else word_codes
+        windows, column_offset = get_windows(codes, len(word), axis)
+        compatible = ((windows == 0) | (windows == target)).all(axis=-1)
+        rows, columns = numpy.nonzero(compatible)
+        columns = columns + column_offset
+        if reverse:
+            rows, columns = rows + axis[0] * extent, columns + axis[1] * extent
+        candidates.append((rows, columns, numpy.full(len(rows), direction_index)))
+    rows, columns, directions = zip(*candidates)
+    return numpy.concatenate(rows), numpy.concatenate(columns), numpy.concatenate(directions)
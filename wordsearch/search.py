@@ -1,7 +1,14 @@
+import math
 import re
 
-from collections import namedtuple
-from functools import partial
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque, namedtuple
+from itertools import accumulate, groupby
+from operator import itemgetter
+
+import numpy
+
+from numpy.lib.stride_tricks import as_strided
 
 
 WordMatch = namedtuple("WordMatch", ("word", "start", "end"))
@@ -13,27 +20,341 @@ def match_is_valid(match, field_width):
     return (start // field_width) == ((end - 1) // field_width)
 
 
-def find_standard(word, field):
+def is_byte_field(field):
+    """Check whether 'field' holds one byte per cell, as dtype S1 or uint8."""
+    return field.dtype in (numpy.dtype("S1"), numpy.dtype(numpy.uint8))
+
+
+def flatten_field(field):
+    """Get the text of 'field' read row by row.
+
+    Byte fields are read straight from the array's buffer, giving bytes.
+    """
+    if is_byte_field(field):
+        return field.tobytes()
+    return "".join(field.flat)
+
+
+def can_occur(word, field):
+    """Check whether 'word' could occur in 'field', as byte fields only hold ASCII."""
+    return word.isascii() or not is_byte_field(field)
+
+
+def as_pattern(word, text):
+    """Get 'word' as the same type as 'text', encoding it if 'text' is bytes."""
+    return word.encode("ascii") if isinstance(text, bytes) else word
+
+
+class Lines(namedtuple("Lines", ("text", "starts", "origins", "axis"))):
+    """Text of every line of a field along 'axis', read one after another.
+
+    'axis' is the (row step, column step) between consecutive characters of
+    a line. 'starts' holds the offset into 'text' at which each line starts
+    and 'origins' the (row, column) of its first character.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_field(cls, field, axis):
+        """Build the Lines of 'field' along 'axis', one of AXES."""
+        height, width = field.shape
+        if axis == (0, 1):
+            text = flatten_field(field)
+            starts = range(0, height * width, width)
+            origins = [(row, 0) for row in range(height)]
+        elif axis == (1, 0):
+            text = flatten_field(field.T)
+            starts = range(0, height * width, height)
+            origins = [(0, column) for column in range(width)]
+        else:
+            # Antidiagonals are the diagonals of the left-right flipped field
+            source = field if axis == (1, 1) else numpy.fliplr(field)
+            offsets = range(1 - height, width)
+            join = b"".join if is_byte_field(field) else "".join
+            text = join(flatten_field(source.diagonal(offset)) for offset in offsets)
+            lengths = [min(height + offset, width - offset, height, width) for offset in offsets]
+            starts = [0, *accumulate(lengths[:-1])]
+            origins = [(max(0, -offset), max(0, offset)) for offset in offsets]
+            if axis == (1, -1):
+                origins = [(row, width - 1 - column) for row, column in origins]
+        return cls(text=text, starts=starts, origins=origins, axis=axis)
+
+    def line_number(self, offset):
+        """Get the index of the line containing 'offset'."""
+        return bisect_right(self.starts, offset) - 1
+
+    def coordinates(self, offset):
+        """Get the (row, column) of the character at 'offset' in 'text'."""
+        line_number = self.line_number(offset)
+        position = offset - self.starts[line_number]
+        row, column = self.origins[line_number]
+        row_step, column_step = self.axis
+        return row + row_step * position, column + column_step * position
+
+    def iter_lines(self):
+        """Yield (text, origin) for each line."""
+        ends = [*self.starts[1:], len(self.text)]
+        for start, end, origin in zip(self.starts, ends, self.origins):
+            yield self.text[start:end], origin
+
+
+def locate_cell(shape, axis, row, column):
+    """Get the (line number, position) of cell ('row', 'column') in the Lines along 'axis'.
+
+    'shape' is that of the field. 'row' and 'column' may also be arrays of
+    cells.
+    """
+    height, width = shape
+    if axis == (0, 1):
+        return row, column
+    if axis == (1, 0):
+        return column, row
+    if axis == (1, -1):
+        column = width - 1 - column
+    return column - row + height - 1, numpy.minimum(row, column)
+
+
+class LineIndex:
+    """Flattened text of a field, shared between finders.
+
+    The Lines along each of AXES are only built the first time they're
+    asked for.
+    """
+
+    def __init__(self, field):
+        self.field = field
+        self.shape = field.shape
+        self._lines = {}
+        self._positions = {}
+        self._codes = {}
+        self._masks = {}
+        self._remaining = {}
+
+    def lines(self, axis):
+        """Get the Lines of the field along 'axis', one of AXES."""
+        if axis not in self._lines:
+            self._lines[axis] = Lines.from_field(self.field, axis)
+        return self._lines[axis]
+
+    def positions(self, character):
+        """Get the (rows, columns) arrays of the cells holding 'character'.
+
+        The cells of each character are only found the first time they're
+        asked for.
+        """
+        if character not in self._positions:
+            if can_occur(character, self.field):
+                code = get_word_codes(character, self.field)[0]
+                self._positions[character] = numpy.nonzero(field_codes(self.field) == code)
+            else:
+                self._positions[character] = numpy.nonzero(numpy.zeros(self.shape, bool))
+        return self._positions[character]
+
+    def count(self, character):
+        """Get the number of cells holding 'character'."""
+        rows, _ = self.positions(character)
+        return len(rows)
+
+    def locate(self, axis, row, column):
+        """Get the (line number, position) of cell ('row', 'column') along 'axis'.
+
+        'row' and 'column' may also be arrays of cells.
+        """
+        return locate_cell(self.shape, axis, row, column)
+
+    def codes(self, axis):
+        """Get the text of the Lines along 'axis' as an array of codepoints."""
+        if axis not in self._codes:
+            text = self.lines(axis).text
+            if isinstance(text, bytes):
+                self._codes[axis] = numpy.frombuffer(text, numpy.uint8)
+            else:
+                self._codes[axis] = numpy.frombuffer(text.encode("utf-32-le"), numpy.uint32)
+        return self._codes[axis]
+
+    def mask(self, axis, character):
+        """Get a boolean array marking each offset holding 'character' in the Lines along 'axis'.
+
+        Masks are kept for reuse by later queries.
+        """
+        if (axis, character) not in self._masks:
+            if can_occur(character, self.field):
+                self._masks[axis, character] = self.codes(axis) == ord(character)
+            else:
+                self._masks[axis, character] = numpy.zeros(len(self.codes(axis)), bool)
+        return self._masks[axis, character]
+
+    def remaining(self, axis):
+        """Get the number of characters from each offset to the end of its line along 'axis'."""
+        if axis not in self._remaining:
+            lines = self.lines(axis)
+            ends = numpy.asarray([*lines.starts[1:], len(lines.text)])
+            lengths = numpy.diff(numpy.asarray([0, *ends]))
+            line_numbers = numpy.repeat(numpy.arange(len(lengths)), lengths)
+            self._remaining[axis] = ends[line_numbers] - numpy.arange(len(lines.text))
+        return self._remaining[axis]
+
+    def offsets(self, axis, rows, columns):
+        """Get the offsets of the cells at 'rows', 'columns' in the Lines along 'axis'."""
+        line_numbers, positions = self.locate(axis, rows, columns)
+        return numpy.asarray(self.lines(axis).starts)[line_numbers] + positions
+
+
+class IncrementalLineIndex(LineIndex):
+    """LineIndex kept up to date as cells of the field are edited.
+
+    The text of each line along AXES is held separately, along with the
+    matches found in it for each word searched so far. Calling 'update'
+    after changing a cell rewrites and forgets the matches of only the four
+    lines through it, so find_all only rescans lines that have changed.
+
+    Lines joined for other finders have the changed character copied into
+    them, rather than being joined again, but those finders still scan the
+    whole text. Character positions, codes and masks are rebuilt when next
+    asked for.
+    """
+
+    def __init__(self, field):
+        super().__init__(field)
+        self._texts = {}
+        self._origins = {}
+        self._matches = {}
+        for axis in AXES:
+            lines = Lines.from_field(field, axis)
+            self._texts[axis] = [text for text, _ in lines.iter_lines()]
+            self._origins[axis] = lines.origins
+            self._matches[axis] = [{} for _ in lines.origins]
+
+    def lines(self, axis):
+        """Get the Lines of the field along 'axis', joined from the line texts."""
+        if axis not in self._lines:
+            texts = self._texts[axis]
+            join = b"".join if is_byte_field(self.field) else "".join
+            self._lines[axis] = Lines(
+                text=join(texts),
+                starts=[0, *accumulate(map(len, texts[:-1]))],
+                origins=self._origins[axis],
+                axis=axis
+            )
+        return self._lines[axis]
+
+    def update(self, row, column):
+        """Refresh the lines through cell ('row', 'column') after it's changed."""
+        character = flatten_field(self.field[row:row + 1, column:column + 1])
+        for axis in AXES:
+            line_number, position = self.locate(axis, row, column)
+            text = self._texts[axis][line_number]
+            self._texts[axis][line_number] = text[:position] + character + text[position + 1:]
+            self._matches[axis][line_number] = {}
+            lines = self._lines.get(axis)
+            if lines is not None:
+                # Lines never change length, so only the one character moves
+                offset = lines.starts[line_number] + position
+                text = lines.text[:offset] + character + lines.text[offset + 1:]
+                self._lines[axis] = lines._replace(text=text)
+        self._positions.clear()
+        self._codes.clear()
+        self._masks.clear()
+
+    def _scan_line(self, word, axis, line_number):
+        """Get lists of the forward and reversed WordMatches of 'word' in one line."""
+        text = self._texts[axis][line_number]
+        row, column = self._origins[axis][line_number]
+        row_step, column_step = axis
+
+        def coordinates(position):
+            return row + row_step * position, column + column_step * position
+
+        forward, backward = [], []
+        if not can_occur(word, self.field):
+            return forward, backward
+        for pattern, found in ((word, forward), (word[::-1], backward)):
+            for match in re.finditer(as_pattern(pattern, text), text):
+                start, end = match.start(), match.end() - 1
+                found.append((coordinates(start), coordinates(end)))
+        return (
+            [WordMatch(word=word, start=start, end=end) for start, end in forward],
+            [WordMatch(word=word, start=end, end=start) for start, end in backward]
+        )
+
+    def line_matches(self, word, axis, line_number):
+        """Get the cached (forward, reversed) WordMatches of 'word' in one line."""
+        cache = self._matches[axis][line_number]
+        if word not in cache:
+            cache[word] = self._scan_line(word, axis, line_number)
+        return cache[word]
+
+    def find_all(self, word):
+        """Find all occurrences of 'word', in the same order as find_all.
+
+        Each line is searched on its own, and only lines changed since
+        'word' was last searched for are scanned again.
+        """
+        for axis in AXES:
+            line_numbers = range(len(self._texts[axis]))
+            for reverse in (0, 1):
+                for line_number in line_numbers:
+                    yield from self.line_matches(word, axis, line_number)[reverse]
+
+
+def get_lines(field, axis, line_index=None):
+    """Get the Lines of 'field' along 'axis', from 'line_index' if given."""
+    if line_index is not None:
+        return line_index.lines(axis)
+    return Lines.from_field(field, axis)
+
+
+def find_in_lines(word, lines):
+    """Yield (start, end) coordinates of each occurrence of 'word' within one of 'lines'.
+
+    Each line is searched on its own, so a match running on from one line
+    into the next can't hide a match that lies wholly within a line.
+    """
+    if isinstance(lines.text, bytes) and not word.isascii():
+        return
+    pattern = re.compile(as_pattern(word, lines.text))
+    row_step, column_step = lines.axis
+    ends = [*lines.starts[1:], len(lines.text)]
+    for line_start, line_end, (row, column) in zip(lines.starts, ends, lines.origins):
+        for match in pattern.finditer(lines.text, line_start, line_end):
+            start, end = match.span()
+            start, end = start - line_start, end - line_start - 1  # We want the final index
+            yield (
+                (row + row_step * start, column + column_step * start),
+                (row + row_step * end, column + column_step * end)
+            )
+
+
+def find_standard(word, field, line_index=None):
     """Find any left-to-right oriented occurrences of 'word' in 'field'."""
-    _, width = field.shape
-    flat_field = "".join(field.flat)
-    is_valid = partial(match_is_valid, field_width=width)
-    for match in filter(is_valid, re.finditer(word, flat_field)):
-        start, end = match.span()
-        end = end - 1  # We want the final index
-        start_row, end_row = map(lambda i: i // width, (start, end))
-        start_column, end_column = map(lambda i: i % width, (start, end))
+    lines = get_lines(field, (0, 1), line_index)
+    for start, end in find_in_lines(word, lines):
+        yield WordMatch(word=word, start=start, end=end)
+
+
+def find_reversed(word, field, line_index=None):
+    """Find any right-to-left oriented occurrences of 'word' in 'field'."""
+    reversed_word = "".join(reversed(word))
+    for word_match in find_standard(reversed_word, field, line_index=line_index):
         yield WordMatch(
             word=word,
-            start=(start_row, start_column),
-            end=(end_row, end_column)
+            start=word_match.end,
+            end=word_match.start
         )
 
 
-def find_reversed(word, field):
-    """Find any right-to-left oriented occurrences of 'word' in 'field'."""
+def find_vertical(word, field, line_index=None):
+    """Find any top-to-bottom oriented occurrences of 'word' in 'field'."""
+    lines = get_lines(field, (1, 0), line_index)
+    for start, end in find_in_lines(word, lines):
+        yield WordMatch(word=word, start=start, end=end)
+
+
+def find_reversed_vertical(word, field, line_index=None):
+    """Find any bottom-to-top oriented occurrences of 'word' in 'field'."""
     reversed_word = "".join(reversed(word))
-    for word_match in find_standard(reversed_word, field):
+    for word_match in find_vertical(reversed_word, field, line_index=line_index):
         yield WordMatch(
             word=word,
             start=word_match.end,
@@ -41,29 +362,39 @@ def find_reversed(word, field):
         )
 
 
-def find_vertical(word, field):
-    """Find any top-to-bottom oriented occurrences of 'word' in 'field'."""
-    transposed_field = field.T
-    for word_match in find_standard(word, transposed_field):
-        start_column, start_row = word_match.start
-        end_column, end_row = word_match.end
+def find_diagonal(word, field, line_index=None):
+    """Find any top-left to bottom-right oriented occurrences of 'word' in 'field'."""
+    lines = get_lines(field, (1, 1), line_index)
+    for start, end in find_in_lines(word, lines):
+        yield WordMatch(word=word, start=start, end=end)
+
+
+def find_reversed_diagonal(word, field, line_index=None):
+    """Find any bottom-right to top-left oriented occurrences of 'word' in 'field'."""
+    reversed_word = "".join(reversed(word))
+    for word_match in find_diagonal(reversed_word, field, line_index=line_index):
         yield WordMatch(
             word=word,
-            start=(start_row, start_column),
-            end=(end_row, end_column)
+            start=word_match.end,
+            end=word_match.start
         )
 
 
-def find_reversed_vertical(word, field):
-    """Find any bottom-to-top oriented occurrences of 'word' in 'field'."""
-    transposed_field = field.T
-    for word_match in find_reversed(word, transposed_field):
-        start_column, start_row = word_match.start
-        end_column, end_row = word_match.end
+def find_antidiagonal(word, field, line_index=None):
+    """Find any top-right to bottom-left oriented occurrences of 'word' in 'field'."""
+    lines = get_lines(field, (1, -1), line_index)
+    for start, end in find_in_lines(word, lines):
+        yield WordMatch(word=word, start=start, end=end)
+
+
+def find_reversed_antidiagonal(word, field, line_index=None):
+    """Find any bottom-left to top-right oriented occurrences of 'word' in 'field'."""
+    reversed_word = "".join(reversed(word))
+    for word_match in find_antidiagonal(reversed_word, field, line_index=line_index):
         yield WordMatch(
             word=word,
-            start=(start_row, start_column),
-            end=(end_row, end_column)
+            start=word_match.end,
+            end=word_match.start
         )
 
 
@@ -71,11 +402,689 @@ FIND_FUNCS = (
     find_standard,
     find_reversed,
     find_vertical,
-    find_reversed_vertical
+    find_reversed_vertical,
+    find_diagonal,
+    find_reversed_diagonal,
+    find_antidiagonal,
+    find_reversed_antidiagonal
 )
 
+# (row step, column step) of the direction searched by each of FIND_FUNCS
+DIRECTIONS = (
+    (0, 1),
+    (0, -1),
+    (1, 0),
+    (-1, 0),
+    (1, 1),
+    (-1, -1),
+    (1, -1),
+    (-1, 1)
+)
+
+# Directions along which Lines are read. Each one is searched forwards and
+# in reverse, giving all of DIRECTIONS.
+AXES = DIRECTIONS[::2]
+
 
-def find_all(word, field):
-    """Find all occurrences of 'word' in 'field'."""
+def find_all(word, field, line_index=None):
+    """Find all occurrences of 'word' in 'field'.
+
+    Pass a LineIndex of 'field' as 'line_index' to avoid re-flattening the
+    field for every direction.
+    """
     for find_func in FIND_FUNCS:
-        yield from find_func(word, field)
+        yield from find_func(word, field, line_index=line_index)
+
+
+def iter_direction_lines(direction, line_index):
+    """Yield (text, origin) for each line of the field read in 'direction'.
+
+    'origin' is the (row, column) of the first character of 'text'. Lines
+    of byte fields are decoded, so 'text' is always a str.
+    """
+    row_step, column_step = direction
+    reverse = direction not in AXES
+    axis = (-row_step, -column_step) if reverse else direction
+    for line, (row, column) in line_index.lines(axis).iter_lines():
+        if isinstance(line, bytes):
+            line = line.decode("ascii")
+        if reverse:
+            extent = len(line) - 1
+            yield line[::-1], (row - row_step * extent, column - column_step * extent)
+        else:
+            yield line, (row, column)
+
+
+def walk_trie(trie, line, start, min_length=1):
+    """Yield (end, word) for each word of 'trie' read from 'line[start]' onwards."""
+    node = trie.root
+    for end in range(start, len(line)):
+        node = node.get(line[end])
+        if node is None:
+            return
+        word = node.get(trie.END)
+        if word is not None and end - start + 1 >= min_length:
+            yield end, word
+
+
+def discover_words(trie, field, min_length=1, line_index=None):
+    """Find all occurrences of any word in 'trie' in 'field'.
+
+    Each cell is walked in every one of DIRECTIONS, stopping as soon as the
+    characters read so far aren't a prefix of any word. Only words of at
+    least 'min_length' characters are reported.
+    """
+    if line_index is None:
+        line_index = LineIndex(field)
+    for row_step, column_step in DIRECTIONS:
+        for line, (row, column) in iter_direction_lines((row_step, column_step), line_index):
+            for start in range(len(line)):
+                for end, word in walk_trie(trie, line, start, min_length):
+                    yield WordMatch(
+                        word=word,
+                        start=(row + row_step * start, column + column_step * start),
+                        end=(row + row_step * end, column + column_step * end)
+                    )
+
+
+class AhoCorasick:
+    """Automaton for finding many literal patterns in a single pass over a text."""
+
+    def __init__(self, patterns):
+        self.patterns = [*patterns]
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for pattern_index, pattern in enumerate(self.patterns):
+            if pattern:
+                self._add_pattern(pattern, pattern_index)
+        self._build_fail_links()
+
+    def _add_pattern(self, pattern, pattern_index):
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(pattern_index)
+
+    def _build_fail_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def iter_matches(self, text):
+        """Yield (start, pattern_index) for every occurrence of a pattern in 'text'.
+
+        Overlapping occurrences are all reported, ordered by where they end.
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        patterns = self.patterns
+        state = 0
+        for offset, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_index in output[state]:
+                yield offset - len(patterns[pattern_index]) + 1, pattern_index
+
+
+def non_overlapping(starts, length):
+    """Filter sorted 'starts' the way re.finditer skips overlapping matches.
+
+    Only matches within a single line should be passed, as each line is
+    searched separately.
+    """
+    next_start = 0
+    for start in starts:
+        if start >= next_start:
+            yield start
+            next_start = start + length
+
+
+def find_all_aho_corasick(words, field, line_index=None):
+    """Find all occurrences of each of 'words' in 'field' with one automaton.
+
+    The lines along each of AXES are scanned once for every word and its
+    reverse. Words are matched literally, but otherwise this yields the
+    same WordMatch objects in the same order as calling find_all for each
+    word in turn.
+    """
+    words = [word for word in words if can_occur(word, field)]
+    if line_index is None:
+        line_index = LineIndex(field)
+
+    patterns = {}
+    for word in words:
+        for pattern in (word, "".join(reversed(word))):
+            patterns.setdefault(pattern, len(patterns))
+    if is_byte_field(field):
+        automaton = AhoCorasick(pattern.encode("ascii") for pattern in patterns)
+    else:
+        automaton = AhoCorasick(patterns)
+
+    starts = {}
+    for axis in AXES:
+        for start, pattern_index in automaton.iter_matches(line_index.lines(axis).text):
+            starts.setdefault((axis, pattern_index), []).append(start)
+
+    def iter_spans(pattern, axis):
+        lines = line_index.lines(axis)
+        pattern_starts = [
+            start for start in starts.get((axis, patterns[pattern]), ())
+            if lines.line_number(start) == lines.line_number(start + len(pattern) - 1)
+        ]
+        for start in non_overlapping(pattern_starts, len(pattern)):
+            yield lines.coordinates(start), lines.coordinates(start + len(pattern) - 1)
+
+    for word in words:
+        if not word:
+            continue
+        reversed_word = "".join(reversed(word))
+        for axis in AXES:
+            for start, end in iter_spans(word, axis):
+                yield WordMatch(word=word, start=start, end=end)
+            for start, end in iter_spans(reversed_word, axis):
+                yield WordMatch(word=word, start=end, end=start)
+
+
+def field_codes(field):
+    """View 'field' as an array of codepoints, without copying.
+
+    U1 fields give uint32 codepoints and byte fields give uint8 codes.
+    """
+    if is_byte_field(field):
+        return field.view(numpy.uint8)
+    return field.view(numpy.uint32)
+
+
+def get_word_codes(word, field):
+    """Get 'word' as codepoints comparable with field_codes(field)."""
+    if is_byte_field(field):
+        return numpy.frombuffer(word.encode("ascii"), numpy.uint8)
+    return field_codes(numpy.array([*word], dtype="U1"))
+
+
+def get_windows(array, length, axis):
+    """Get a read-only view of every 'length'-long run of 'array' along 'axis'.
+
+    'axis' is one of AXES. Element [i, j] of the result is the run starting
+    at row i and column j + column_offset. Returns (windows, column_offset).
+    """
+    height, width = array.shape
+    row_step, column_step = axis
+    extent = length - 1
+    column_offset = extent if column_step < 0 else 0
+    if height - row_step * extent < 1 or width - abs(column_step) * extent < 1:
+        return numpy.empty((0, 0, length), array.dtype), column_offset
+    row_stride, column_stride = array.strides
+    windows = as_strided(
+        array[:, column_offset:],
+        shape=(height - row_step * extent, width - abs(column_step) * extent, length),
+        strides=(row_stride, column_stride, row_step * row_stride + column_step * column_stride),
+        writeable=False
+    )
+    return windows, column_offset
+
+
+def find_windows(codes, word_codes, axis):
+    """Get the (rows, columns) where runs along 'axis' of 'codes' equal 'word_codes'."""
+    windows, column_offset = get_windows(codes, len(word_codes), axis)
+    rows, columns = numpy.nonzero((windows == word_codes).all(axis=-1))
+    return rows, columns + column_offset
+
+
+def find_all_numpy(words, field, line_index=None):
+    """Find all occurrences of each of 'words' in 'field' with array comparisons.
+
+    Every window of the field along each direction is compared against the
+    word at once. Words are matched literally and, unlike the regex engine,
+    overlapping occurrences are all reported. Matches are yielded by word,
+    then by direction in the same order as FIND_FUNCS and then along each
+    line, as the literal engine yields them.
+    """
+    codes = field_codes(field)
+    for word in words:
+        if not (word and can_occur(word, field)):
+            continue
+        word_codes = get_word_codes(word, field)
+        extent = len(word) - 1
+        for row_step, column_step in AXES:
+            for target, reverse in ((word_codes, False), (word_codes[::-1], True)):
+                rows, columns = find_windows(codes, target, (row_step, column_step))
+                line_numbers, positions = locate_cell(
+                    field.shape, (row_step, column_step), rows, columns
+                )
+                order = numpy.lexsort((positions, line_numbers))
+                rows, columns = rows[order], columns[order]
+                for row, column in zip(rows.tolist(), columns.tolist()):
+                    first = (row, column)
+                    last = (row + row_step * extent, column + column_step * extent)
+                    start, end = (last, first) if reverse else (first, last)
+                    yield WordMatch(word=word, start=start, end=end)
+
+
+def find_literal(pattern, text):
+    """Yield the offset of every occurrence of 'pattern' in 'text', overlapping or not."""
+    offset = text.find(pattern)
+    while offset != -1:
+        yield offset
+        offset = text.find(pattern, offset + 1)
+
+
+def iter_occurrences(word, line_index):
+    """Yield (direction index, first, last) for every occurrence of 'word' within a line.
+
+    Occurrences are found by plain substring search, overlapping or not,
+    by direction in the same order as DIRECTIONS. 'first' and 'last' are
+    the cells of the occurrence's first and last characters along its line,
+    so in reversed directions 'first' holds the word's last letter.
+    """
+    if not can_occur(word, line_index.field):
+        return
+    reversed_word = "".join(reversed(word))
+    for axis_index, axis in enumerate(AXES):
+        lines = line_index.lines(axis)
+        for reverse, target in enumerate((word, reversed_word)):
+            pattern = as_pattern(target, lines.text)
+            for start in find_literal(pattern, lines.text):
+                end = start + len(pattern) - 1
+                if lines.line_number(start) != lines.line_number(end):
+                    continue
+                yield 2 * axis_index + reverse, lines.coordinates(start), lines.coordinates(end)
+
+
+def find_all_literal(words, field, line_index=None):
+    """Find all occurrences of each of 'words' in 'field' by plain substring search.
+
+    Words are matched literally, without compiling a regex for each one,
+    and overlapping occurrences are all reported. Matches are yielded by
+    word, then by direction in the same order as FIND_FUNCS.
+    """
+    if line_index is None:
+        line_index = LineIndex(field)
+    for word in words:
+        if not word:
+            continue
+        for direction_index, first, last in iter_occurrences(word, line_index):
+            start, end = (last, first) if direction_index % 2 else (first, last)
+            yield WordMatch(word=word, start=start, end=end)
+
+
+def find_all_anchored(words, field, line_index=None):
+    """Find all occurrences of each of 'words' in 'field', starting from rare letters.
+
+    Each word is only compared with the text around the cells holding its
+    rarest letter, taken from the character positions of 'line_index'.
+    Words are matched literally, but otherwise this yields the same
+    WordMatch objects in the same order as calling find_all for each word
+    in turn.
+    """
+    if line_index is None:
+        line_index = LineIndex(field)
+    for word in words:
+        if not (word and can_occur(word, field)):
+            continue
+        anchor = min(range(len(word)), key=lambda index: line_index.count(word[index]))
+        rows, columns = line_index.positions(word[anchor])
+        reversed_word = "".join(reversed(word))
+        for axis in AXES:
+            lines = line_index.lines(axis)
+            offsets = numpy.sort(line_index.offsets(axis, rows, columns))
+            for target, index in ((word, anchor), (reversed_word, len(word) - 1 - anchor)):
+                pattern = as_pattern(target, lines.text)
+                found = [
+                    start for start in (offsets - index).tolist()
+                    if start >= 0 and lines.text.startswith(pattern, start)
+                    and lines.line_number(start) == lines.line_number(start + len(pattern) - 1)
+                ]
+                for start in non_overlapping(found, len(pattern)):
+                    end = start + len(pattern) - 1
+                    first, last = lines.coordinates(start), lines.coordinates(end)
+                    start, end = (last, first) if target is reversed_word else (first, last)
+                    yield WordMatch(word=word, start=start, end=end)
+
+
+def match_segment(segment, line_index, axis):
+    """Get a boolean array marking the offsets where 'segment' matches along 'axis'.
+
+    'segment' is matched within a single line, with "?" matching any
+    character.
+    """
+    size = len(line_index.lines(axis).text)
+    found = line_index.remaining(axis) >= len(segment)
+    if len(segment) > size:
+        return found
+    for index, character in enumerate(segment):
+        if character != "?":
+            found[:size - index] &= line_index.mask(axis, character)[index:]
+    return found
+
+
+def iter_pattern_spans(pattern, line_index, axis):
+    """Yield (start, end) offsets of each run matching 'pattern' in the Lines along 'axis'.
+
+    Runs are yielded by start, then by end.
+    """
+    segments = pattern.split("*")
+    starts = numpy.flatnonzero(match_segment(segments[0], line_index, axis)).tolist()
+    if len(segments) == 1:
+        for start in starts:
+            yield start, start + len(pattern) - 1
+        return
+
+    text = line_index.lines(axis).text
+    remaining = line_index.remaining(axis)
+    tail = segments[-1]
+    tail_starts = numpy.flatnonzero(match_segment(tail, line_index, axis))
+    ends = (tail_starts + max(len(tail) - 1, 0)).tolist()
+    regex = ".*".join(re.escape(segment).replace(r"\?", ".") for segment in segments)
+    regex = re.compile(as_pattern(regex, text))
+    min_length = max(len(pattern) - len(segments) + 1, 1)
+    for start in starts:
+        line_end = start + remaining[start] - 1
+        low = bisect_left(ends, start + min_length - 1)
+        high = bisect_right(ends, line_end)
+        for end in ends[low:high]:
+            if len(segments) == 2 or regex.fullmatch(text, start, end + 1):
+                yield start, end
+
+
+def find_pattern(pattern, field, line_index=None):
+    """Find every run of 'field' matching 'pattern', read in any direction.
+
+    In 'pattern', "?" matches any one character and "*" matches any number
+    of them. Each WordMatch holds the text of the run it covers. Runs are
+    yielded by direction in the same order as FIND_FUNCS, and overlapping
+    runs are all reported. The masks built in 'line_index' are reused by
+    later queries.
+    """
+    if not (pattern and can_occur(pattern, field)):
+        return
+    if line_index is None:
+        line_index = LineIndex(field)
+    reversed_pattern = "".join(reversed(pattern))
+    for axis in AXES:
+        lines = line_index.lines(axis)
+        for target, reverse in ((pattern, False), (reversed_pattern, True)):
+            for start, end in iter_pattern_spans(target, line_index, axis):
+                text = lines.text[start:end + 1]
+                if isinstance(text, bytes):
+                    text = text.decode("ascii")
+                first, last = lines.coordinates(start), lines.coordinates(end)
+                if reverse:
+                    yield WordMatch(word=text[::-1], start=last, end=first)
+                else:
+                    yield WordMatch(word=text, start=first, end=last)
+
+
+def find_all_words(words, field, line_index=None):
+    """Find all occurrences of each of 'words' in 'field', one word at a time."""
+    if line_index is None:
+        line_index = LineIndex(field)
+    for word in words:
+        yield from find_all(word, field, line_index=line_index)
+
+
+SOLVE_ENGINES = {
+    "regex": find_all_words,
+    "aho-corasick": find_all_aho_corasick,
+    "numpy": find_all_numpy,
+    "literal": find_all_literal,
+    "anchored": find_all_anchored
+}
+
+
+# Engines reporting every occurrence of a word, rather than skipping overlapping ones
+OVERLAPPING_ENGINES = {"numpy", "literal"}
+
+
+def get_solve_engine(engine):
+    """Get the function from SOLVE_ENGINES named 'engine'."""
+    try:
+        return SOLVE_ENGINES[engine]
+    except KeyError:
+        raise ValueError(f"Unknown engine: {engine}") from None
+
+
+def iter_tiles(shape, band_size, overlap):
+    """Yield (rows, columns, owned) slices splitting a field of 'shape' into tiles.
+
+    The field is split into bands of 'band_size' rows and each band into
+    'band_size' columns. 'owned' is the (rows, columns) slice of the tile
+    itself, and 'rows' and 'columns' extend it by 'overlap' cells down and
+    to the right.
+    """
+    height, width = shape
+    for row in range(0, height, band_size):
+        for column in range(0, width, band_size):
+            owned = (slice(row, row + band_size), slice(column, column + band_size))
+            rows = slice(row, min(row + band_size + overlap, height))
+            columns = slice(column, min(column + band_size + overlap, width))
+            yield rows, columns, owned
+
+
+def get_band_size(shape, workers, tiles_per_worker=4):
+    """Get a band_size splitting a field of 'shape' into 'tiles_per_worker' tiles per worker.
+
+    Tiles are square, so a field may be split into a few more.
+    """
+    height, width = shape
+    return max(1, int(math.sqrt(height * width / (workers * tiles_per_worker))))
+
+
+# Characters with a special meaning in a regex
+REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+def check_tiled_words(words, engine):
+    """Raise ValueError if searching tiles can't find what 'engine' finds for 'words'.
+
+    Tiles match words literally, so words for the "regex" engine can't
+    hold any of REGEX_METACHARACTERS.
+    """
+    if engine != "regex":
+        return
+    for word in words:
+        if REGEX_METACHARACTERS.intersection(word):
+            raise ValueError(f"Cannot search tiles for a regex pattern: {word}")
+
+
+def find_all_in_tile(words, field, tile):
+    """Find the occurrences of 'words' owned by one tile from iter_tiles.
+
+    The tile is copied out of 'field' and every occurrence of each word is
+    found in it, overlapping or not. Occurrences are kept only if their
+    top-left-most cell is in the tile's owned area, and are yielded as
+    (word, direction index, first) as from iter_occurrences, with 'first'
+    in the coordinates of 'field'. Pass them to merge_occurrences to get
+    the matches of an engine.
+    """
+    rows, columns, (owned_rows, owned_columns) = tile
+    line_index = LineIndex(numpy.array(field[rows, columns]))
+    for word in dict.fromkeys(words):
+        if not word:
+            continue
+        for direction_index, first, last in iter_occurrences(word, line_index):
+            top = rows.start + min(first[0], last[0])
+            left = columns.start + min(first[1], last[1])
+            owned = (
+                owned_rows.start <= top < owned_rows.stop
+                and owned_columns.start <= left < owned_columns.stop
+            )
+            if owned:
+                yield word, direction_index, (rows.start + first[0], columns.start + first[1])
+
+
+def merge_occurrences(occurrences, words, shape, engine="regex"):
+    """Get the list of WordMatch objects 'engine' finds for 'words' from their 'occurrences'.
+
+    'occurrences' are (word, direction index, first) tuples as yielded by
+    find_all_in_tile for every tile of a field of 'shape', in any order.
+    Unless 'engine' is one of OVERLAPPING_ENGINES, occurrences overlapping
+    an earlier one along the same line are skipped, as each engine skips
+    them when searching the whole field. Matches are ordered as the engine
+    orders them, by word, by direction and by position along each line.
+    """
+    get_solve_engine(engine)
+    located = defaultdict(list)
+    for word, direction_index, (row, column) in occurrences:
+        line_number, position = locate_cell(shape, AXES[direction_index // 2], row, column)
+        located[word].append((direction_index, int(line_number), int(position), row, column))
+
+    matches = {}
+    for word, found in located.items():
+        found.sort()
+        matches[word] = []
+        for (direction_index, _), group in groupby(found, key=itemgetter(0, 1)):
+            cells = {position: (row, column) for _, _, position, row, column in group}
+            positions = cells
+            if engine not in OVERLAPPING_ENGINES:
+                positions = non_overlapping(cells, len(word))
+            for position in positions:
+                matches[word].append(occurrence_match(word, direction_index, cells[position]))
+    return [match for word in words for match in matches.get(word, ())]
+
+
+def occurrence_match(word, direction_index, first):
+    """Get the WordMatch of an occurrence of 'word' as yielded by find_all_in_tile."""
+    row_step, column_step = AXES[direction_index // 2]
+    extent = len(word) - 1
+    last = (first[0] + row_step * extent, first[1] + column_step * extent)
+    start, end = (last, first) if direction_index % 2 else (first, last)
+    return WordMatch(word=word, start=start, end=end)
+
+
+class OverlapSkipper:
+    """Skips occurrences overlapping an earlier one along a line, as they're found.
+
+    Occurrences are added under a (word, direction index, line number) key
+    with their position along the line. 'resolve' decides the pending
+    occurrences of a key in order of position, carrying on from those
+    decided before, so it must only be called once every earlier
+    occurrence along that line has been added.
+    """
+
+    def __init__(self):
+        self._pending = defaultdict(list)
+        self._next_starts = {}
+        self._kept = set()
+
+    def add(self, key, position):
+        self._pending[key].append(position)
+
+    def resolve(self, key):
+        """Decide which pending occurrences under 'key' are kept."""
+        positions = self._pending.pop(key, ())
+        next_start = self._next_starts.get(key, 0)
+        for position in sorted(positions):
+            if position >= next_start:
+                self._kept.add((key, position))
+                next_start = position + len(key[0])
+        self._next_starts[key] = next_start
+
+    def is_kept(self, key, position):
+        """Check whether a resolved occurrence is kept, forgetting it."""
+        if (key, position) in self._kept:
+            self._kept.remove((key, position))
+            return True
+        return False
+
+
+def find_all_banded(words, field, band_size=1024, engine="regex"):
+    """Find all occurrences of each of 'words' in 'field', one tile at a time.
+
+    Only one tile of the field is read into memory at once, so 'field' may
+    be a memory-mapped array larger than RAM. Tiles overlap by the length
+    of the longest word less one, so every occurrence lies entirely within
+    the tile that owns its top-left-most cell, and is reported by that tile
+    alone. Words are matched literally, giving the matches 'engine' from
+    SOLVE_ENGINES finds in the whole field, but they're yielded tile by
+    tile in the order of iter_tiles and by word within each tile.
+
+    Unless 'engine' is one of OVERLAPPING_ENGINES, which tiles' matches
+    skip depends on earlier tiles along each line. Tiles are taken band by
+    band, so a line's earlier cells are in earlier bands or, for an
+    antidiagonal, the next tile of the same band. A tile's matches are
+    therefore yielded once the next tile in its band has been searched.
+    """
+    words = [*words]
+    if not words:
+        return
+    get_solve_engine(engine)
+    check_tiled_words(words, engine)
+    overlap = max(map(len, words)) - 1
+    word_indices = {word: index for index, word in reversed([*enumerate(words)])}
+
+    def locate(occurrence):
+        word, direction_index, (row, column) = occurrence
+        axis = AXES[direction_index // 2]
+        line_number, position = locate_cell(field.shape, axis, row, column)
+        return (word, direction_index, int(line_number)), int(position)
+
+    def iter_matches(located):
+        def order(item):
+            (word, direction_index, line_number), position, _ = item
+            return word_indices[word], direction_index, line_number, position
+
+        by_word = defaultdict(list)
+        for (word, direction_index, _), _, first in sorted(located, key=order):
+            by_word[word].append(occurrence_match(word, direction_index, first))
+        for word in words:
+            yield from by_word.get(word, ())
+
+    skipper = OverlapSkipper()
+
+    def iter_kept(located):
+        for key in {key for key, _, _ in located}:
+            skipper.resolve(key)
+        return iter_matches(
+            (key, position, first) for key, position, first in located
+            if skipper.is_kept(key, position)
+        )
+
+    held_row, held = None, []
+    for tile in iter_tiles(field.shape, band_size, overlap):
+        located = [
+            (*locate(occurrence), occurrence[2])
+            for occurrence in find_all_in_tile(words, field, tile)
+        ]
+        if engine in OVERLAPPING_ENGINES:
+            yield from iter_matches(located)
+            continue
+
+        band_row = tile[2][0].start
+        if band_row != held_row:
+            # The held tile ended its band, so nothing later can precede its occurrences
+            yield from iter_kept(held)
+            held = []
+        for key, position, _ in located:
+            skipper.add(key, position)
+        yield from iter_kept(held)
+        held_row, held = band_row, located
+    yield from iter_kept(held)
+
+
+def get_direction_index(word_match):
+    """Get the index in DIRECTIONS of the direction 'word_match' reads in.
+
+    Single-character matches read in every direction and give 0.
+    """
+    (start_row, start_column), (end_row, end_column) = word_match.start, word_match.end
+    row_step = (end_row > start_row) - (end_row < start_row)
+    column_step = (end_column > start_column) - (end_column < start_column)
+    if not (row_step or column_step):
+        return 0
+    return DIRECTIONS.index((row_step, column_step))
@@ -0,0 +1,62 @@
+from collections import Counter, defaultdict
+
+
+def direction_key(direction):
+    """Get a (row step, column step) 'direction' as a string such as "1,-1"."""
+    return ",".join(map(str, direction))
+
+
+class Stats:
+    """Counts and timings recorded while generating or solving wordsearches.
+
+    Pass one as 'stats' to Wordsearch.generate or Wordsearch.solve to record
+    into it. The same Stats can be passed to many calls to accumulate their
+    totals. Directions are (row step, column step) tuples, as in DIRECTIONS.
+    """
+
+    def __init__(self):
+        # Word -> number of placements tried
+        self.placement_attempts = Counter()
+        # Word -> Counter of placements rejected in each direction
+        self.placement_rejections = defaultdict(Counter)
+        self.fill_time = 0.0
+        self.solve_time = 0.0
+        # Direction -> seconds spent and matches found by its finder
+        self.scan_time = defaultdict(float)
+        self.scan_matches = Counter()
+
+    def record_placement(self, word, direction, valid):
+        """Record an attempt to place 'word' in 'direction' and whether it was 'valid'."""
+        self.placement_attempts[word] += 1
+        if not valid:
+            self.placement_rejections[word][direction] += 1
+
+    def record_scan(self, direction, seconds, matches):
+        """Record a scan in 'direction' taking 'seconds' and finding 'matches' occurrences."""
+        self.scan_time[direction] += seconds
+        self.scan_matches[direction] += matches
+
+    def rejections_by_direction(self):
+        """Get a Counter of rejected placements in each direction, over all words."""
+        total = Counter()
+        for rejections in self.placement_rejections.values():
+            total.update(rejections)
+        return total
+
+    def as_dict(self):
+        """Get the recorded values as a dict that can be serialised as JSON."""
+        return {
+            "placement_attempts": dict(self.placement_attempts),
+            "placement_rejections": {
+                word: {direction_key(direction): count for direction, count in rejections.items()}
+                for word, rejections in self.placement_rejections.items()
+            },
+            "fill_time": self.fill_time,
+            "solve_time": self.solve_time,
+            "scan_time": {
+                direction_key(direction): seconds for direction, seconds in self.scan_time.items()
+            },
+            "scan_matches": {
+                direction_key(direction): count for direction, count in self.scan_matches.items()
+            },
+        }
@@ -0,0 +1,34 @@
+class Trie:
+    """Prefix tree of words, for pruning searches by prefix.
+
+    Each node is a dict mapping characters to child nodes. A node that
+    completes a word also maps Trie.END to that word.
+    """
+
+    END = None
+
+    def __init__(self, words=()):
+        self.root = {}
+        self._length = 0
+        for word in words:
+            self.add(word)
+
+    def add(self, word):
+        """Add 'word' to the trie."""
+        node = self.root
+        for char in word:
+            node = node.setdefault(char, {})
+        if self.END not in node:
+            node[self.END] = word
+            self._length += 1
+
+    def __contains__(self, word):
+        node = self.root
+        for char in word:
+            node = node.get(char)
+            if node is None:
+                return False
+        return self.END in node
+
+    def __len__(self):
+        return self._length
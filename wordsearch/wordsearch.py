@@ -1,7 +1,41 @@
+import time
+
+from collections import defaultdict, deque
+
 import numpy
 
-from wordsearch.placements import get_placement, placement_is_valid
-from wordsearch.search import find_all
+from wordsearch.placements import (
+    Placement,
+    get_compact_placement,
+    compact_placement_is_valid,
+    write_placement,
+    occupancy_codes,
+    get_placement_candidates,
+    random_integer
+)
+from wordsearch.cache import fingerprint_field
+from wordsearch.matches import MatchArray
+from wordsearch.parallel import attach_array, imap_ordered, share_array
+from wordsearch.search import (
+    AXES,
+    DIRECTIONS,
+    FIND_FUNCS,
+    WordMatch,
+    IncrementalLineIndex,
+    LineIndex,
+    check_tiled_words,
+    discover_words,
+    find_all,
+    find_all_banded,
+    find_all_in_tile,
+    find_pattern,
+    get_band_size,
+    get_solve_engine,
+    iter_tiles,
+    is_byte_field,
+    merge_occurrences
+)
+from wordsearch.trie import Trie
 
 
 MAX_PLACEMENT_ATTEMPTS = 10
@@ -24,63 +58,557 @@ def validate_word_and_field(word, field_width, field_height):
         raise AssertionError(msg)
 
 
-def place_word(word, field):
-    """Place 'word' into 'field' with a random position and orientation."""
+def place_word(word, field, placement="random", rng=None, stats=None):
+    """Place 'word' into 'field' with a random position and orientation.
+
+    With 'placement' as "random", placements are drawn at random until one
+    fits, giving up after MAX_PLACEMENT_ATTEMPTS. With "enumerate", one is
+    chosen uniformly from every placement that fits, so PlacementError is
+    only raised if there are none. Random draws use the Generator 'rng', or
+    numpy's global random state if it's None.
+
+    Each placement tried is recorded in 'stats', if given a Stats.
+    """
+    placement = choose_placement(word, field, placement=placement, rng=rng, stats=stats)
+    return write_placement(placement, field)
+
+
+def choose_placement(word, field, placement="random", rng=None, stats=None):
+    """Choose a Placement of 'word' compatible with 'field', as place_word does."""
     field_height, field_width = field.shape
     validate_word_and_field(word, field_height, field_width)
 
+    if placement == "enumerate":
+        placement = choose_placement_from_candidates(word, field, rng=rng)
+        if stats is not None:
+            stats.record_placement(word, placement.direction, True)
+        return placement
+    if placement != "random":
+        raise ValueError(f"Unknown placement: {placement}")
+
     placement_attempts = 0
     valid_placement_found = False
     while not valid_placement_found:
-        placement = get_placement(word, field_width, field_height)
-        valid_placement_found = placement_is_valid(placement, field)
+        placement = get_compact_placement(word, field_width, field_height, rng=rng)
+        valid_placement_found = compact_placement_is_valid(placement, field)
+        if stats is not None:
+            stats.record_placement(word, placement.direction, valid_placement_found)
         placement_attempts += 1
         if placement_attempts >= MAX_PLACEMENT_ATTEMPTS:
             raise PlacementError(f"Cannot place word: {word} in current field.")
-    word_coords = numpy.where(placement.astype(bool))
-    field[word_coords] = placement[word_coords]
-    return field
+    return placement
+
+
+def choose_placement_from_candidates(word, field, rng=None):
+    """Choose a Placement of 'word' from all that fit 'field'."""
+    rows, columns, directions = get_placement_candidates(word, field)
+    if not len(rows):
+        raise PlacementError(f"Cannot place word: {word} in current field.")
+    index = random_integer(0, len(rows), rng=rng)
+    return Placement(
+        word=word,
+        start=(rows[index], columns[index]),
+        direction=DIRECTIONS[directions[index]]
+    )
+
+
+def backtrack_placements(words, field, time_budget=None, rng=None):
+    """Place all of 'words' into 'field', undoing placements that lead to dead ends.
+
+    The field is held as an array of codepoints, with 0 for empty cells.
+    At each step, the word with the fewest compatible placements is placed
+    next, longest first on ties. Its placements are tried in random order
+    and undone if the remaining words can no longer all be placed.
+
+    Gives up with a PlacementError if every arrangement fails or after
+    'time_budget' seconds. Returns the filled field, the list of Placements
+    made and the number of placements tried.
+    """
+    field_height, field_width = field.shape
+    for word in words:
+        validate_word_and_field(word, field_height, field_width)
 
+    codes = occupancy_codes(field).copy()
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    nodes_explored = 0
+    placements = []
 
-def fill_field(field, characters):
-    """Fill null elements of 'field' with randomly-selected 'characters'."""
-    background = numpy.random.choice([*characters], field.shape)
+    def place_remaining(remaining):
+        nonlocal nodes_explored
+        if not remaining:
+            return True
+
+        most_constrained = None
+        for word in sorted(remaining, key=len, reverse=True):
+            candidates = get_placement_candidates(word, codes)
+            if not len(candidates[0]):
+                return False
+            if most_constrained is None or len(candidates[0]) < len(most_constrained[1][0]):
+                most_constrained = (word, candidates)
+        word, (rows, columns, directions) = most_constrained
+        word_codes = occupancy_codes(numpy.array([*word], dtype="U1"))
+        remaining = [*remaining]
+        remaining.remove(word)
+
+        for index in (numpy.random if rng is None else rng).permutation(len(rows)):
+            if deadline is not None and time.monotonic() > deadline:
+                msg = f"Ran out of time after exploring {nodes_explored} placements."
+                raise PlacementError(msg)
+            nodes_explored += 1
+            placement = Placement(
+                word=word,
+                start=(rows[index], columns[index]),
+                direction=DIRECTIONS[directions[index]]
+            )
+            word_coords = placement.coordinates()
+            newly_filled = codes[word_coords] == 0
+            codes[word_coords] = word_codes
+            placements.append(placement)
+            if place_remaining(remaining):
+                return True
+            placements.pop()
+            codes[word_coords[0][newly_filled], word_coords[1][newly_filled]] = 0
+        return False
+
+    if not place_remaining(words):
+        msg = f"Cannot place words in field after exploring {nodes_explored} placements."
+        raise PlacementError(msg)
+
+    field = numpy.where(codes != 0, codes.view("U1"), None)
+    return field, placements, nodes_explored
+
+
+def fill_field(field, characters, rng=None, words=None):
+    """Fill null elements of 'field' with randomly-selected 'characters'.
+
+    If 'words' are given, cells are filled one at a time and no letter is
+    used that would complete another occurrence of one of them, read in any
+    direction. PlacementError is raised if no character can be used.
+    """
+    if words is not None:
+        return fill_field_unique(field, characters, words, rng=rng)
+    background = (numpy.random if rng is None else rng).choice([*characters], field.shape)
     null_field_coords = numpy.where(~field.astype(bool))
     field[null_field_coords] = background[null_field_coords]
     return field
 
 
+def fill_field_unique(field, characters, words, rng=None):
+    """Fill null elements of 'field' without completing any more of 'words'."""
+    splits = index_word_splits(words)
+    word_lengths = {*map(len, words)}
+    characters = [*characters]
+    for row, column in zip(*numpy.where(~field.astype(bool))):
+        forbidden = get_forbidden_letters(field, row, column, splits, word_lengths)
+        allowed = [character for character in characters if character not in forbidden]
+        if not allowed:
+            raise PlacementError(f"Cannot fill cell {(row, column)} without repeating a word.")
+        field[row, column] = allowed[random_integer(0, len(allowed), rng=rng)]
+    return field
+
+
+def index_word_splits(words):
+    """Map each (prefix, suffix) of a letter in 'words' to the letters found between them.
+
+    Words are indexed reversed as well, so a letter is in the set for
+    (prefix, suffix) if prefix + letter + suffix reads as a word either way.
+    """
+    splits = defaultdict(set)
+    for word in words:
+        for oriented in (word, word[::-1]):
+            for index, letter in enumerate(oriented):
+                splits[oriented[:index], oriented[index + 1:]].add(letter)
+    return dict(splits)
+
+
+def read_filled(field, row, column, step, limit):
+    """Read up to 'limit' consecutive filled cells from beside ('row', 'column') along 'step'."""
+    height, width = field.shape
+    row_step, column_step = step
+    letters = []
+    row, column = row + row_step, column + column_step
+    while len(letters) < limit and 0 <= row < height and 0 <= column < width:
+        if not field[row, column]:
+            break
+        letters.append(field[row, column])
+        row, column = row + row_step, column + column_step
+    return "".join(letters)
+
+
+def get_forbidden_letters(field, row, column, splits, word_lengths):
+    """Get letters which would complete a word at empty cell ('row', 'column').
+
+    Only the filled cells along each of AXES through the cell are read, and
+    'splits' is the index of words built by index_word_splits.
+    """
+    limit = max(word_lengths, default=1) - 1
+    forbidden = set()
+    for row_step, column_step in AXES:
+        before = read_filled(field, row, column, (-row_step, -column_step), limit)[::-1]
+        after = read_filled(field, row, column, (row_step, column_step), limit)
+        for length in word_lengths:
+            for prefix_length in range(max(0, length - 1 - len(after)),
+                                       min(len(before), length - 1) + 1):
+                prefix = before[len(before) - prefix_length:]
+                suffix = after[:length - 1 - prefix_length]
+                forbidden.update(splits.get((prefix, suffix), ()))
+    return forbidden
+
+
+def to_byte_field(field):
+    """Convert a U1 'field' of ASCII characters to an S1 field of a quarter the size."""
+    return field.astype("S1")
+
+
+def to_unicode_field(field):
+    """Convert an S1 or uint8 'field' of ASCII codes to a U1 field."""
+    return field.view("S1").astype("U1")
+
+
 class Wordsearch:
     """Wrapper for a wordsearch array."""
 
     DEFAULT_CHARACTERS = "ABCDEFGHIJKLMNOPQRXTUVWXYZ"
 
-    def __init__(self, field):
+    # Number of placements tried while generating with strategy="backtrack"
+    nodes_explored = None
+
+    # Words hidden by generate and the Placement of each, in the order placed
+    words = None
+    placements = None
+
+    def __init__(self, field, incremental=False):
+        self.incremental = incremental
         self.field = field
 
         if self.field.ndim != 2:
             msg = "Please provide a 2D array"
             raise WordsearchInitialisationError(msg)
 
-        if not self.field.dtype == "<U1":
-            msg = "Please provide an array of dtype U1"
+        if not (self.field.dtype == "<U1" or is_byte_field(self.field)):
+            msg = "Please provide an array of dtype U1, S1 or uint8"
             raise WordsearchInitialisationError(msg)
 
+    @property
+    def field(self):
+        return self._field
+
+    @field.setter
+    def field(self, field):
+        self._field = field
+        self._line_index = None
+        self._fingerprint = None
+
+    @property
+    def fingerprint(self):
+        """Hash of the field's contents, computed on first use.
+
+        Like the line index, it's reset when 'field' is reassigned or a cell
+        is assigned through the wordsearch.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = fingerprint_field(self.field)
+        return self._fingerprint
+
+    @property
+    def line_index(self):
+        """LineIndex of the field, built on first use.
+
+        The index is discarded whenever 'field' is reassigned. Edits made
+        in-place to the field array aren't tracked, so make them through
+        place_word or by assigning cells of the wordsearch itself. If the
+        wordsearch is 'incremental', those edits update an
+        IncrementalLineIndex rather than discarding it. Only solve with the
+        "regex" engine, iter_solve, first_match and contains then rescan no
+        more than the lines changed. Other engines, query and discover
+        still read the whole field, though without joining its text again.
+        """
+        if self._line_index is None:
+            index_type = IncrementalLineIndex if self.incremental else LineIndex
+            self._line_index = index_type(self.field)
+        return self._line_index
+
+    def __setitem__(self, cell, character):
+        """Set the (row, column) 'cell' of the field to 'character'."""
+        self.field[cell] = character
+        self._fingerprint = None
+        if self._line_index is None:
+            return
+        if self.incremental:
+            row, column = (index % size for index, size in zip(cell, self.field.shape))
+            self._line_index.update(row, column)
+        else:
+            self._line_index = None
+
+    def place_word(self, word, placement="random", rng=None, stats=None):
+        """Place 'word' into the field as the module's place_word does.
+
+        Only cells holding "" are free, and other cells may only be covered
+        by the same letter. Returns the Placement chosen.
+        """
+        placement = choose_placement(word, self.field, placement=placement, rng=rng, stats=stats)
+        rows, columns = placement.coordinates()
+        for row, column, letter in zip(rows.tolist(), columns.tolist(), word):
+            self[row, column] = letter
+        return placement
+
+    @classmethod
+    def from_file(cls, path, shape):
+        """Open a wordsearch whose field is the raw bytes of the file at 'path'.
+
+        The file holds one ASCII byte per cell, row by row, for a field of
+        'shape' (height, width). It is memory-mapped read-only, not loaded.
+        """
+        return cls(numpy.memmap(path, dtype="S1", mode="r", shape=shape))
+
     @classmethod
-    def generate(cls, words, width, height, characters=DEFAULT_CHARACTERS):
+    def generate(cls, words, width, height, characters=DEFAULT_CHARACTERS,
+                 placement="random", strategy="greedy", time_budget=None, dtype="U1",
+                 unique=False, rng=None, stats=None):
+        """Generate a wordsearch hiding 'words' in a field of random 'characters'.
+
+        The "greedy" strategy places words one at a time in the given order,
+        as chosen by 'placement'. The "backtrack" strategy undoes placements
+        when later words can't fit, giving up after 'time_budget' seconds,
+        and records the placements it tried as 'nodes_explored'. The words
+        and the Placement of each are kept as 'words' and 'placements'.
+
+        'dtype' may be "S1" or "uint8" to store the field with one byte per
+        cell, if 'words' and 'characters' are ASCII.
+
+        With 'unique', the field is filled without completing any further
+        occurrences of 'words', read in any direction. Occurrences formed by
+        the placed words themselves, such as a word inside another, remain.
+
+        Random draws use the numpy.random.Generator 'rng', or numpy's global
+        random state if it's None.
+
+        Pass a Stats as 'stats' to record the placements tried for each word
+        by the "greedy" strategy and the time spent filling the field.
+        """
+        words = [*words]
         shape = (height, width)
         field = numpy.full(shape, None)
+        nodes_explored = None
+        if strategy == "greedy":
+            placements = []
+            for word in words:
+                chosen = choose_placement(word, field, placement=placement, rng=rng, stats=stats)
+                write_placement(chosen, field)
+                placements.append(chosen)
+        elif strategy == "backtrack":
+            field, placements, nodes_explored = backtrack_placements(
+                words, field, time_budget=time_budget, rng=rng
+            )
+        else:
+            raise ValueError(f"Unknown strategy: {strategy}")
+        fill_start = time.perf_counter()
+        field = fill_field(field, characters, rng=rng, words=words if unique else None)
+        if stats is not None:
+            stats.fill_time += time.perf_counter() - fill_start
+        if dtype == "U1":
+            field = field.astype("U1")
+        elif dtype in ("S1", "uint8"):
+            field = field.astype("S1").view(dtype)
+        else:
+            raise ValueError(f"Unsupported dtype: {dtype}")
+        wordsearch = cls(field)
+        wordsearch.nodes_explored = nodes_explored
+        wordsearch.words = words
+        wordsearch.placements = placements
+        return wordsearch
+
+    @classmethod
+    def generate_many(cls, specs, workers=None, seed=None, chunksize=8):
+        """Yield a generated wordsearch for each of 'specs', in order.
+
+        Each spec is a dict of keyword arguments for generate. Every spec
+        gets its own numpy.random.Generator spawned from a SeedSequence of
+        'seed', so the results depend only on 'seed' and the specs, however
+        they're spread over 'workers' processes. Specs are sent to workers
+        in chunks of 'chunksize'.
+        """
+        jobs = ((cls, spec, seed_sequence) for spec, seed_sequence in iter_seeded(specs, seed))
+        yield from imap_ordered(_generate_job, jobs, workers=workers, chunksize=chunksize)
+
+    def solve(self, words, engine="regex", workers=None, band_size=None, cache=None,
+              stats=None, columnar=False):
+        """Get a list of WordMatch objects for found 'words'.
+
+        'engine' selects how the field is searched. "regex" scans the field
+        once per word and direction, "aho-corasick" scans it once for all
+        words together and "numpy" compares every window of the field
+        against each word with array operations. "literal" finds words by
+        plain substring search, reporting overlapping occurrences.
+        "anchored" only checks the text around the cells holding each word's
+        rarest letter.
+
+        With 'workers', the field is split into overlapping tiles of
+        'band_size' cells square which are searched in a pool of that many
+        processes. By default tiles are sized to give each worker several.
+        Words are matched literally in each tile, and the occurrences are
+        merged into the same matches, in the same order, as 'engine' finds
+        without workers. So with workers, words for the "regex" engine
+        mustn't be regex patterns, or ValueError is raised.
+
+        Pass a SolveCache as 'cache' to reuse the matches of words already
+        solved in a field with the same contents, with the same 'engine'.
+        Only the words missing from the cache are searched for.
+
+        Pass a Stats as 'stats' to record the time taken. With the "regex"
+        engine, the time spent and matches found by each of FIND_FUNCS are
+        recorded under its direction too.
+
+        With 'columnar', matches are returned as a MatchArray, which holds
+        them as columns of integers and yields WordMatch objects when
+        iterated.
+        """
+        if columnar:
+            words = [*words]
+            if engine == "regex" and not (workers or cache or stats):
+                return MatchArray.from_matches(self.iter_solve(words), words)
+            return MatchArray.from_matches(
+                self.solve(words, engine, workers, band_size, cache, stats), words
+            )
+
+        start = time.perf_counter()
+        matches = self._solve(words, engine, workers, band_size, cache, stats)
+        if stats is not None:
+            stats.solve_time += time.perf_counter() - start
+        return matches
+
+    def _solve(self, words, engine, workers, band_size, cache, stats):
+        if cache is not None:
+            return self._solve_cached(words, engine, workers, band_size, cache, stats)
+
+        if workers:
+            return self._solve_tiles(words, engine, workers, band_size)
+
+        if engine == "regex":
+            if stats is not None and not self.incremental:
+                return [*self._iter_solve_scans(words, stats)]
+            return [*self.iter_solve(words)]
+
+        find_words = get_solve_engine(engine)
+        return [*find_words(words, self.field, line_index=self.line_index)]
+
+    def _iter_solve_scans(self, words, stats):
         for word in words:
-            place_word(word, field)
-        field = fill_field(field, characters)
-        return cls(field.astype("U1"))
+            for direction, find_func in zip(DIRECTIONS, FIND_FUNCS):
+                start = time.perf_counter()
+                matches = [*find_func(word, self.field, line_index=self.line_index)]
+                stats.record_scan(direction, time.perf_counter() - start, len(matches))
+                yield from matches
 
-    def solve(self, words):
-        """Get a list of WordMatch objects for found 'words'."""
-        matches = []
+    def _solve_cached(self, words, engine, workers, band_size, cache, stats):
+        words = [*words]
+        found = {}
         for word in words:
-            matches.extend(find_all(word, self.field))
-        return matches
+            if word not in found:
+                found[word] = cache.get((self.fingerprint, engine, word))
+        missing = [word for word, matches in found.items() if matches is None]
+        if missing:
+            solved = {word: [] for word in missing}
+            for match in self._solve(missing, engine, workers, band_size, None, stats):
+                solved[match.word].append(match)
+            for word, matches in solved.items():
+                found[word] = tuple(matches)
+                cache.put((self.fingerprint, engine, word), found[word])
+        return [match for word in words for match in found[word]]
+
+    def _solve_tiles(self, words, engine, workers, band_size):
+        words = [*words]
+        get_solve_engine(engine)
+        check_tiled_words(words, engine)
+        if not words:
+            return []
+        if band_size is None:
+            band_size = get_band_size(self.field.shape, workers)
+        overlap = max(map(len, words)) - 1
+        tiles = iter_tiles(self.field.shape, band_size, overlap)
+
+        shared_memory, shared = share_array(self.field)
+        try:
+            jobs = ((shared, tile, words) for tile in tiles)
+            occurrences = []
+            for records in imap_ordered(_solve_tile_job, jobs, workers):
+                occurrences.extend(
+                    (words[word_index], direction_index, (row, column))
+                    for word_index, direction_index, row, column in records
+                )
+        finally:
+            shared_memory.close()
+            shared_memory.unlink()
+        return merge_occurrences(occurrences, words, self.field.shape, engine=engine)
+
+    def iter_solve(self, words):
+        """Yield WordMatch objects for found 'words' lazily, in word order."""
+        for word in words:
+            yield from self._find_all(word)
+
+    def _find_all(self, word):
+        if self.incremental:
+            return self.line_index.find_all(word)
+        return find_all(word, self.field, line_index=self.line_index)
+
+    def first_match(self, word):
+        """Get the first WordMatch found for 'word', or None if it's absent.
+
+        Directions are searched in the order of FIND_FUNCS and the search
+        stops at the first occurrence.
+        """
+        return next(self._find_all(word), None)
+
+    def contains(self, word):
+        """Check whether 'word' occurs anywhere in the field."""
+        return self.first_match(word) is not None
+
+    def iter_solve_banded(self, words, band_size=1024, engine="regex"):
+        """Yield WordMatch objects for found 'words', searching one tile at a time.
+
+        Only a tile of 'band_size' by 'band_size' cells, plus an overlap of
+        the longest word's length, is held in memory at once. Use this for
+        fields too large to flatten, such as those opened with from_file.
+        Words are matched literally, giving the matches 'engine' finds in
+        the whole field, but they're yielded as tiles are searched, in
+        tile order rather than word order.
+        """
+        yield from find_all_banded(words, self.field, band_size=band_size, engine=engine)
+
+    def query(self, pattern):
+        """Get a list of WordMatch objects for each run of the field matching 'pattern'.
+
+        "?" matches any one character and "*" any number of them, so
+        "C?T" finds three-letter runs such as "CAT" and "QU*" every run
+        starting "QU". Each WordMatch holds the text of its run. Indexes of
+        each character's offsets are kept, so repeated queries of the same
+        field don't rescan it.
+        """
+        return [*find_pattern(pattern, self.field, line_index=self.line_index)]
+
+    def discover(self, dictionary, min_length=1):
+        """Yield a WordMatch for every occurrence of any 'dictionary' word.
+
+        'dictionary' is a Trie, or an iterable of words to build one from.
+        Build the Trie once to reuse it across many wordsearches.
+        """
+        if not isinstance(dictionary, Trie):
+            dictionary = Trie(dictionary)
+        yield from discover_words(
+            dictionary, self.field, min_length=min_length, line_index=self.line_index
+        )
+
+    def to_bytes(self):
+        """Get a copy of this wordsearch with an S1 field."""
+        if is_byte_field(self.field):
+            return type(self)(self.field.view("S1"))
+        return type(self)(to_byte_field(self.field))
+
+    def to_unicode(self):
+        """Get a copy of this wordsearch with a U1 field."""
+        if is_byte_field(self.field):
+            return type(self)(to_unicode_field(self.field))
+        return type(self)(self.field.copy())
 
     def _row_as_string(self, row):
         row_string = "| " + " | ".join(row) + " |"
@@ -88,9 +616,142 @@ class Wordsearch:
 
     def as_string(self):
         """Get a text representation of this wordsearch."""
-        height, width = self.field.shape
+        field = self.field
+        if is_byte_field(field):
+            field = to_unicode_field(field)
+        height, width = field.shape
         row_border = "".join(["|-", "--|-" * (width - 1), "--|"])
         lines = [row_border]
-        for row in [self._row_as_string(row) for row in self.field]:
+        for row in [self._row_as_string(row) for row in field]:
             lines.extend([row, row_border])
         return "\n".join(lines)
+
+
+def iter_seeded(specs, seed=None):
+    """Yield (spec, SeedSequence) for each of 'specs', spawned in turn from 'seed'.
+
+    Each SeedSequence depends only on 'seed' and the position of its spec.
+    """
+    seed_sequence = numpy.random.SeedSequence(seed)
+    for spec in specs:
+        yield spec, seed_sequence.spawn(1)[0]
+
+
+def generate_seeded(cls, spec, seed_sequence):
+    """Generate a wordsearch of 'cls' from 'spec', drawing from 'seed_sequence'."""
+    return cls.generate(**spec, rng=numpy.random.default_rng(seed_sequence))
+
+
+def _generate_job(job):
+    """Generate a wordsearch from a (class, spec, SeedSequence) job."""
+    return generate_seeded(*job)
+
+
+def index_words(words):
+    """Map each of 'words' to the index of its first occurrence."""
+    word_indices = {}
+    for index, word in enumerate(words):
+        word_indices.setdefault(word, index)
+    return word_indices
+
+
+def to_match_records(matches, words):
+    """Get 'matches' of 'words' as compact tuples of integers.
+
+    Each match becomes (word index, start row, start column, end row, end
+    column), which is much cheaper to send between processes than a
+    WordMatch.
+    """
+    word_indices = index_words(words)
+    return [(word_indices[match.word], *match.start, *match.end) for match in matches]
+
+
+def from_match_records(records, words):
+    """Get WordMatch objects back from compact 'records' of 'words'."""
+    return [
+        WordMatch(
+            word=words[word_index],
+            start=(start_row, start_column),
+            end=(end_row, end_column)
+        )
+        for word_index, start_row, start_column, end_row, end_column in records
+    ]
+
+
+def _solve_shared_job(job):
+    """Solve a (SharedArray, words, engine, errors) job, returning compact match records.
+
+    An exception of one of the 'errors' types is returned instead of raised.
+    """
+    shared, words, engine, errors = job
+    failure = None
+    with attach_array(shared) as field:
+        try:
+            matches = Wordsearch(field).solve(words, engine=engine)
+        except errors as error:
+            # The traceback would hold on to the shared field past its release
+            failure = error.with_traceback(None)
+        del field
+    if failure is not None:
+        return failure
+    return to_match_records(matches, words)
+
+
+def _solve_tile_job(job):
+    """Search a (SharedArray, tile, words) job, returning compact occurrence records.
+
+    Each record is (word index, direction index, row, column) of an
+    occurrence from find_all_in_tile.
+    """
+    shared, tile, words = job
+    word_indices = index_words(words)
+    with attach_array(shared) as field:
+        records = [
+            (word_indices[word], direction_index, row, column)
+            for word, direction_index, (row, column) in find_all_in_tile(words, field, tile)
+        ]
+        del field
+    return records
+
+
+def solve_many(puzzles, workers=None, engine="regex", chunksize=1, errors=()):
+    """Yield the list of WordMatch objects for each (field, words) of 'puzzles', in order.
+
+    With 'workers', puzzles are solved in a pool of that many processes.
+    Fields are passed to workers through shared memory rather than being
+    pickled, and matches come back as compact tuples of integers. If
+    solving a puzzle raises an exception of one of the 'errors' types, the
+    exception is yielded in place of its matches.
+    """
+    if not workers:
+        for field, words in puzzles:
+            try:
+                matches = Wordsearch(field).solve(words, engine=engine)
+            except errors as error:
+                matches = error
+            yield matches
+        return
+
+    pending = deque()
+
+    def iter_jobs():
+        for field, words in puzzles:
+            words = [*words]
+            shared_memory, shared = share_array(field)
+            pending.append((shared_memory, words))
+            yield shared, words, engine, errors
+
+    try:
+        results = imap_ordered(_solve_shared_job, iter_jobs(), workers, chunksize=chunksize)
+        for records in results:
+            shared_memory, words = pending.popleft()
+            shared_memory.close()
+            shared_memory.unlink()
+            if isinstance(records, Exception):
+                yield records
+            else:
+                yield from_match_records(records, words)
+    finally:
+        for shared_memory, _ in pending:
+            shared_memory.close()
+            shared_memory.unlink()